@@ -0,0 +1 @@
+"""Archived agent factory scripts, tools and validators"""
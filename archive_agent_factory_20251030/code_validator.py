@@ -5,11 +5,22 @@ NO FALLBACKS - Strict validation only.
 """
 
 import ast
+import os
 import re
-from typing import List, Dict, Any, Set
+import sys
+import threading
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from hashlib import blake2b
+from typing import List, Dict, Any, Set, Optional
 from pydantic import BaseModel
 from loguru import logger
 
+try:
+    import re2 as _secret_regex_engine
+except ImportError:
+    _secret_regex_engine = re
+
 
 class ValidationIssue(BaseModel):
     """A validation issue found in code"""
@@ -26,31 +37,41 @@ class ValidationResult(BaseModel):
     issues: List[ValidationIssue] = []
     risk_score: float = 0.0  # 0.0 = safe, 1.0 = dangerous
     summary: str = ""
+    error_count: int = 0  # Number of ERROR issues, kept so callers need not rescan
+    warning_count: int = 0  # Number of WARNING issues
+
 
+# Name tables are immutable and hold interned strings, matching the interned
+# identifiers the parser puts on ast.Name / ast.Attribute / ast.alias nodes.
 
 # Security: Dangerous functions that should never appear in generated code
-DANGEROUS_FUNCTIONS = {
+DANGEROUS_FUNCTIONS = frozenset(map(sys.intern, (
     'eval', 'exec', 'compile', '__import__', 'execfile',
     'input',  # Can be dangerous in automated contexts
     'open'  # File I/O should be controlled
-}
+)))
 
 # Security: Dangerous imports (imports that should be scrutinized)
-DANGEROUS_IMPORTS = {
+DANGEROUS_IMPORTS = frozenset(map(sys.intern, (
     'subprocess', 'socket', 'urllib',
     'pickle', 'marshal',  # Serialization can be dangerous
     'ctypes', 'cffi'  # Low-level access
-}
+)))
 
 # Conditionally allowed imports (require specific safe usage patterns)
 CONDITIONAL_IMPORTS = {
-    'os': ['getenv', 'environ.get', 'path'],  # Only environment variables and path operations
-    'sys': ['argv', 'exit'],  # Only basic sys functions
-    'requests': []  # Network access - allow but track
+    'os': tuple(map(sys.intern, ('getenv', 'environ.get', 'path'))),  # Only environment variables and path operations
+    'sys': tuple(map(sys.intern, ('argv', 'exit'))),  # Only basic sys functions
+    'requests': ()  # Network access - allow but track
 }
 
+# (module, function) pairs allowed for conditional imports, for O(1) usage checks
+CONDITIONAL_ALLOWED_CALLS = frozenset(
+    (module, func) for module, funcs in CONDITIONAL_IMPORTS.items() for func in funcs
+)
+
 # Allowed imports for agents
-ALLOWED_IMPORTS = {
+ALLOWED_IMPORTS = frozenset(map(sys.intern, (
     # Standard library (safe subset)
     'typing', 'dataclasses', 'enum', 'abc', 'collections',
     'datetime', 'decimal', 'fractions', 'math', 'statistics',
@@ -63,8 +84,93 @@ ALLOWED_IMPORTS = {
     
     # Conditionally allowed (will check usage)
     'os', 'sys', 'requests'
+)))
+
+
+# Security: Hardcoded credentials/secrets, compiled once as a single alternation.
+# Each named group maps to its message; matches are actual values, not env vars
+# or empty strings. Uses RE2 (linear-time DFA matching) when google-re2 is
+# installed; the pattern sticks to syntax both engines accept.
+HARDCODED_SECRET_RE = _secret_regex_engine.compile(
+    r'(?i)(?P<password>password\s*=\s*["\'][\w]{3,}["\'])'
+    r'|(?P<api_key>api_key\s*=\s*["\'][^"\'\n]{8,}["\'])'
+    r'|(?P<secret>secret\s*=\s*["\'][^"\'\n]{8,}["\'])'
+    r'|(?P<token>token\s*=\s*["\'][^"\'\n]{8,}["\'])'
+)
+
+HARDCODED_SECRET_MESSAGES = {
+    'password': "Hardcoded password",
+    'api_key': "Hardcoded API key",
+    'secret': "Hardcoded secret",
+    'token': "Hardcoded token",
 }
 
+# Lines matching these are OK (using env vars, empty strings, etc.)
+SAFE_SECRET_RE = re.compile(r'os\.getenv\(|os\.environ|getenv\(|=\s*["\']["\']')
+
+
+# Process-wide cache of parsed modules, keyed by a digest of the source so the
+# pipeline stages validating the same snippet share one tree. Oldest entries are
+# evicted first once the cache is full.
+_AST_CACHE: Dict[bytes, ast.Module] = {}
+_AST_CACHE_MAX = 256
+
+# Guards eviction and insertion in the caches here: validate_code runs in
+# worker threads, and two of them evicting the same oldest key would collide
+_CACHE_LOCK = threading.Lock()
+
+
+def _code_digest(code: str) -> bytes:
+    """Fixed-size cache key for a code string."""
+    return blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+
+def _parse_cached(code: str) -> ast.Module:
+    """Parse code into an AST, reusing the tree for identical sources."""
+    key = _code_digest(code)
+    tree = _AST_CACHE.get(key)
+    if tree is None:
+        # Straight to the compiler's AST-only mode, skipping the ast.parse wrapper
+        tree = compile(code, '<unknown>', 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+        with _CACHE_LOCK:
+            if len(_AST_CACHE) >= _AST_CACHE_MAX:
+                _AST_CACHE.pop(next(iter(_AST_CACHE)), None)
+            _AST_CACHE[key] = tree
+    return tree
+
+
+def _syntax_error_result(e: SyntaxError) -> ValidationResult:
+    """Build the validation result for code that failed to parse."""
+    logger.error(f"Syntax error: {e}")
+    return ValidationResult(
+        valid=False,
+        issues=[ValidationIssue(
+            severity="ERROR",
+            issue_type="syntax",
+            message=f"Syntax error: {e.msg}",
+            line_number=e.lineno or 0,
+            suggestion="Fix syntax error before proceeding"
+        )],
+        summary=f"Syntax error at line {e.lineno}: {e.msg}",
+        error_count=1
+    )
+
+
+def _parse_failure_result(e: Exception) -> ValidationResult:
+    """Build the validation result for code the parser rejected outright."""
+    logger.error(f"Unexpected error during syntax validation: {e}")
+    return ValidationResult(
+        valid=False,
+        issues=[ValidationIssue(
+            severity="ERROR",
+            issue_type="syntax",
+            message=f"Failed to parse code: {str(e)}",
+            suggestion="Check code structure"
+        )],
+        summary=f"Validation error: {str(e)}",
+        error_count=1
+    )
+
 
 def validate_code_syntax(code: str) -> ValidationResult:
     """
@@ -77,296 +183,373 @@ def validate_code_syntax(code: str) -> ValidationResult:
         ValidationResult with syntax validation results
     """
     logger.info("Validating code syntax...")
-    issues = []
     
     try:
-        # Parse code into AST
-        tree = ast.parse(code)
-        
-        # Check if code is empty
-        if not tree.body:
-            issues.append(ValidationIssue(
-                severity="WARNING",
-                issue_type="syntax",
-                message="Code is empty or contains only comments",
-                suggestion="Ensure code contains actual implementation"
-            ))
-        
-        # Basic structure checks
-        has_class = any(isinstance(node, ast.ClassDef) for node in ast.walk(tree))
-        has_function = any(isinstance(node, ast.FunctionDef) for node in ast.walk(tree))
-        
-        if not has_class and not has_function:
-            issues.append(ValidationIssue(
-                severity="WARNING",
-                issue_type="syntax",
-                message="Code contains no classes or functions",
-                suggestion="Agent code should contain at least a class definition"
-            ))
-        
-        logger.info("✓ Syntax validation passed")
-        
-        return ValidationResult(
-            valid=len([i for i in issues if i.severity == "ERROR"]) == 0,
-            issues=issues,
-            summary=f"Syntax valid, {len(issues)} warnings"
-        )
-        
+        tree = _parse_cached(code)
     except SyntaxError as e:
-        logger.error(f"Syntax error: {e}")
+        return _syntax_error_result(e)
+    except Exception as e:
+        return _parse_failure_result(e)
+    
+    return _validate_syntax(tree, code)
+
+
+def _validate_syntax(tree: ast.Module, code: str) -> ValidationResult:
+    """
+    Run syntax/structure checks on an already-parsed module.
+    
+    Args:
+        tree: Parsed AST of the code
+        code: Python code as string
+    
+    Returns:
+        ValidationResult with syntax validation results
+    """
+    issues = []
+    
+    # Check if code is empty
+    if not tree.body:
         issues.append(ValidationIssue(
-            severity="ERROR",
+            severity="WARNING",
             issue_type="syntax",
-            message=f"Syntax error: {e.msg}",
-            line_number=e.lineno or 0,
-            suggestion="Fix syntax error before proceeding"
+            message="Code is empty or contains only comments",
+            suggestion="Ensure code contains actual implementation"
         ))
-        
-        return ValidationResult(
-            valid=False,
-            issues=issues,
-            summary=f"Syntax error at line {e.lineno}: {e.msg}"
-        )
     
-    except Exception as e:
-        logger.error(f"Unexpected error during syntax validation: {e}")
+    # Basic structure checks
+    has_class = any(isinstance(node, ast.ClassDef) for node in ast.walk(tree))
+    has_function = any(isinstance(node, ast.FunctionDef) for node in ast.walk(tree))
+    
+    if not has_class and not has_function:
         issues.append(ValidationIssue(
-            severity="ERROR",
+            severity="WARNING",
             issue_type="syntax",
-            message=f"Failed to parse code: {str(e)}",
-            suggestion="Check code structure"
+            message="Code contains no classes or functions",
+            suggestion="Agent code should contain at least a class definition"
         ))
-        
-        return ValidationResult(
-            valid=False,
-            issues=issues,
-            summary=f"Validation error: {str(e)}"
-        )
+    
+    logger.info("✓ Syntax validation passed")
+    
+    # Structure checks only ever report warnings
+    return ValidationResult(
+        valid=True,
+        issues=issues,
+        summary=f"Syntax valid, {len(issues)} warnings",
+        warning_count=len(issues)
+    )
 
 
-def validate_code_security(code: str) -> ValidationResult:
+def _security_failure_result(e: Exception) -> ValidationResult:
+    """Build the validation result for a security check that could not run."""
+    logger.error(f"Security validation error: {e}")
+    return ValidationResult(
+        valid=False,
+        issues=[ValidationIssue(
+            severity="ERROR",
+            issue_type="security",
+            message=f"Security validation failed: {str(e)}",
+            suggestion="Fix syntax errors first"
+        )],
+        risk_score=1.0,
+        summary=f"Validation failed: {str(e)}",
+        error_count=1
+    )
+
+
+def validate_code_security(code: str, fail_fast: bool = False) -> ValidationResult:
     """
     Validate code for security issues.
     
     Args:
         code: Python code as string
+        fail_fast: Stop at the first ERROR instead of building a full report
     
     Returns:
         ValidationResult with security validation results
     """
     logger.info("Validating code security...")
-    issues = []
-    risk_score = 0.0
     
     try:
-        tree = ast.parse(code)
-        
+        tree = _parse_cached(code)
+        return _validate_security(tree, code, fail_fast)
+    except Exception as e:
+        return _security_failure_result(e)
+
+
+class _EarlyExit(Exception):
+    """Raised inside the security visitor to abort the traversal in fail-fast mode"""
+
+
+class _SecurityVisitor(ast.NodeVisitor):
+    """
+    Single-pass AST visitor for the call, import and complexity checks.
+    
+    Only descends where a nested node can matter: import statements and
+    leaf expressions (names, constants) are not traversed further.
+    """
+    
+    def __init__(self, fail_fast: bool = False):
+        self.fail_fast = fail_fast
+        self.call_issues: List[ValidationIssue] = []
+        self.import_issues: List[ValidationIssue] = []
+        self.risk_score = 0.0
+        self.conditional_modules: Set[str] = set()  # Track conditionally allowed modules
+        self.module_calls: List[tuple] = []  # (module, func, line) pairs for Check 2b
+        self.function_count = 0
+        self.class_count = 0
+        self.error_count = 0
+        self.warning_count = 0
+    
+    def visit_Call(self, node: ast.Call):
         # Check 1: Dangerous function calls
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                func_name = None
-                if isinstance(node.func, ast.Name):
-                    func_name = node.func.id
-                elif isinstance(node.func, ast.Attribute):
-                    func_name = node.func.attr
-                
-                if func_name in DANGEROUS_FUNCTIONS:
-                    issues.append(ValidationIssue(
-                        severity="ERROR",
-                        issue_type="security",
-                        message=f"Dangerous function call: {func_name}()",
-                        line_number=getattr(node, 'lineno', 0),
-                        suggestion=f"Remove {func_name}() - not allowed in generated agents"
-                    ))
-                    risk_score += 0.3
+        func = node.func
+        func_name = None
+        if isinstance(func, ast.Name):
+            func_name = func.id
+        elif isinstance(func, ast.Attribute):
+            func_name = func.attr
+            # Remember module.func() calls for the conditional usage check
+            if isinstance(func.value, ast.Name):
+                self.module_calls.append((func.value.id, func_name, getattr(node, 'lineno', 0)))
         
-        # Check 2: Import validation
-        imported_modules = set()
-        conditional_modules = {}  # Track conditionally allowed modules
+        if func_name in DANGEROUS_FUNCTIONS:
+            self.call_issues.append(ValidationIssue(
+                severity="ERROR",
+                issue_type="security",
+                message=f"Dangerous function call: {func_name}()",
+                line_number=getattr(node, 'lineno', 0),
+                suggestion=f"Remove {func_name}() - not allowed in generated agents"
+            ))
+            self.risk_score += 0.3
+            self._record_error()
         
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Import):
-                for alias in node.names:
-                    module = alias.name.split('.')[0]
-                    imported_modules.add(module)
-                    
-                    if module in DANGEROUS_IMPORTS:
-                        issues.append(ValidationIssue(
-                            severity="ERROR",
-                            issue_type="security",
-                            message=f"Dangerous import: {module}",
-                            line_number=getattr(node, 'lineno', 0),
-                            suggestion=f"Remove 'import {module}' - not allowed"
-                        ))
-                        risk_score += 0.4
-                    elif module in CONDITIONAL_IMPORTS:
-                        # Track for usage validation
-                        conditional_modules[module] = CONDITIONAL_IMPORTS[module]
-                    elif module not in ALLOWED_IMPORTS and not module.startswith('meta_agent'):
-                        issues.append(ValidationIssue(
-                            severity="WARNING",
-                            issue_type="security",
-                            message=f"Uncommon import: {module}",
-                            line_number=getattr(node, 'lineno', 0),
-                            suggestion=f"Verify {module} is necessary and safe"
-                        ))
-                        risk_score += 0.1
+        # Arguments may contain further calls
+        self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.Import):
+        # Check 2: Import validation
+        for alias in node.names:
+            module = alias.name.split('.')[0]
             
-            elif isinstance(node, ast.ImportFrom):
-                if node.module:
-                    module = node.module.split('.')[0]
-                    imported_modules.add(module)
-                    
-                    if module in DANGEROUS_IMPORTS:
-                        issues.append(ValidationIssue(
-                            severity="ERROR",
-                            issue_type="security",
-                            message=f"Dangerous import: from {module}",
-                            line_number=getattr(node, 'lineno', 0),
-                            suggestion=f"Remove 'from {module} import ...' - not allowed"
-                        ))
-                        risk_score += 0.4
-                    elif module in CONDITIONAL_IMPORTS:
-                        # Track for usage validation
-                        conditional_modules[module] = CONDITIONAL_IMPORTS[module]
-        
-        # Check 2b: Validate usage of conditional imports
-        for node in ast.walk(tree):
-            if isinstance(node, ast.Call):
-                # Check for os.getenv(), os.environ.get(), etc.
-                if isinstance(node.func, ast.Attribute):
-                    if isinstance(node.func.value, ast.Name):
-                        module_name = node.func.value.id
-                        func_name = node.func.attr
-                        
-                        if module_name in conditional_modules:
-                            allowed_funcs = conditional_modules[module_name]
-                            # If specific functions are defined, check if this one is allowed
-                            if allowed_funcs and func_name not in allowed_funcs:
-                                issues.append(ValidationIssue(
-                                    severity="ERROR",
-                                    issue_type="security",
-                                    message=f"Unsafe usage of {module_name}.{func_name}()",
-                                    line_number=getattr(node, 'lineno', 0),
-                                    suggestion=f"Only {', '.join(allowed_funcs)} are allowed for {module_name}"
-                                ))
-                                risk_score += 0.3
-                    
-                    # Check for os.environ.get()
-                    elif isinstance(node.func.value, ast.Attribute):
-                        if isinstance(node.func.value.value, ast.Name):
-                            module_name = node.func.value.value.id
-                            attr_name = node.func.value.attr
-                            func_name = node.func.attr
-                            
-                            if module_name == 'os' and attr_name == 'environ' and func_name == 'get':
-                                # os.environ.get() is safe - do nothing
-                                pass
-        
-        # Check 3: Hardcoded credentials/secrets
-        # Patterns to detect actual hardcoded values (not env vars or empty strings)
-        hardcoded_patterns = [
-            (r'password\s*=\s*["\'][\w]{3,}["\']', "Hardcoded password"),
-            (r'api_key\s*=\s*["\'][^"\'\n]{8,}["\']', "Hardcoded API key"),
-            (r'secret\s*=\s*["\'][^"\'\n]{8,}["\']', "Hardcoded secret"),
-            (r'token\s*=\s*["\'][^"\'\n]{8,}["\']', "Hardcoded token"),
-        ]
-        
-        # Patterns that are OK (using env vars, empty strings, etc.)
-        safe_patterns = [
-            r'os\.getenv\(',
-            r'os\.environ',
-            r'getenv\(',
-            r'=\s*["\']["\']',  # Empty string
-            r'=\s*""',
-            r"=\s*''",
-        ]
-        
-        for pattern, message in hardcoded_patterns:
-            matches = re.finditer(pattern, code, re.IGNORECASE)
-            for match in matches:
-                matched_line = code[code.rfind('\n', 0, match.start())+1:code.find('\n', match.end())]
-                
-                # Check if this line uses safe patterns
-                is_safe = any(re.search(safe_pattern, matched_line) for safe_pattern in safe_patterns)
-                
-                if not is_safe:
-                    # Get line number
-                    line_num = code[:match.start()].count('\n') + 1
-                    issues.append(ValidationIssue(
-                        severity="ERROR",
-                        issue_type="security",
-                        message=message,
-                        line_number=line_num,
-                        suggestion="Use environment variables or config instead"
-                    ))
-                    risk_score += 0.3
+            if module in DANGEROUS_IMPORTS:
+                self.import_issues.append(ValidationIssue(
+                    severity="ERROR",
+                    issue_type="security",
+                    message=f"Dangerous import: {module}",
+                    line_number=getattr(node, 'lineno', 0),
+                    suggestion=f"Remove 'import {module}' - not allowed"
+                ))
+                self.risk_score += 0.4
+                self._record_error()
+            elif module in CONDITIONAL_IMPORTS:
+                # Track for usage validation
+                self.conditional_modules.add(module)
+            elif module not in ALLOWED_IMPORTS and not module.startswith('meta_agent'):
+                self.import_issues.append(ValidationIssue(
+                    severity="WARNING",
+                    issue_type="security",
+                    message=f"Uncommon import: {module}",
+                    line_number=getattr(node, 'lineno', 0),
+                    suggestion=f"Verify {module} is necessary and safe"
+                ))
+                self.risk_score += 0.1
+                self.warning_count += 1
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        # Check 2: Import validation
+        if node.module:
+            module = node.module.split('.')[0]
+            
+            if module in DANGEROUS_IMPORTS:
+                self.import_issues.append(ValidationIssue(
+                    severity="ERROR",
+                    issue_type="security",
+                    message=f"Dangerous import: from {module}",
+                    line_number=getattr(node, 'lineno', 0),
+                    suggestion=f"Remove 'from {module} import ...' - not allowed"
+                ))
+                self.risk_score += 0.4
+                self._record_error()
+            elif module in CONDITIONAL_IMPORTS:
+                # Track for usage validation
+                self.conditional_modules.add(module)
+    
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.function_count += 1
+        self.generic_visit(node)
+    
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.class_count += 1
+        self.generic_visit(node)
+    
+    def _record_error(self):
+        self.error_count += 1
+        if self.fail_fast:
+            raise _EarlyExit()
+    
+    def _skip(self, node: ast.AST):
+        """Leaf expressions carry nothing the security checks look at"""
+        pass
+    
+    visit_Name = _skip
+    visit_Constant = _skip
+
+
+def _validate_security(tree: ast.Module, code: str, fail_fast: bool = False) -> ValidationResult:
+    """
+    Run security checks on an already-parsed module.
+    
+    Args:
+        tree: Parsed AST of the code
+        code: Python code as string
+        fail_fast: Stop at the first ERROR instead of building a full report
+    
+    Returns:
+        ValidationResult with security validation results
+    """
+    # Checks 1, 2 and 4 share a single traversal
+    visitor = _SecurityVisitor(fail_fast)
+    try:
+        visitor.visit(tree)
+    except _EarlyExit:
+        pass
+    issues = visitor.call_issues + visitor.import_issues
+    risk_score = visitor.risk_score
+    error_count = visitor.error_count
+    warning_count = visitor.warning_count
+    conditional_modules = visitor.conditional_modules
+    
+    # Check 2b: Validate usage of conditional imports (os.getenv(), etc.).
+    # Resolved after the walk so imports anywhere in the file are known.
+    for module_name, func_name, line_number in visitor.module_calls:
+        if fail_fast and error_count:
+            break
+        if module_name in conditional_modules and (module_name, func_name) not in CONDITIONAL_ALLOWED_CALLS:
+            allowed_funcs = CONDITIONAL_IMPORTS[module_name]
+            # If specific functions are defined, check if this one is allowed
+            if allowed_funcs:
+                issues.append(ValidationIssue(
+                    severity="ERROR",
+                    issue_type="security",
+                    message=f"Unsafe usage of {module_name}.{func_name}()",
+                    line_number=line_number,
+                    suggestion=f"Only {', '.join(allowed_funcs)} are allowed for {module_name}"
+                ))
+                risk_score += 0.3
+                error_count += 1
+    
+    # Check 3: Hardcoded credentials/secrets (one scan for all patterns)
+    line_starts = None  # Offsets of each line start, built on the first match
+    for match in HARDCODED_SECRET_RE.finditer(code):
+        if fail_fast and error_count:
+            break
+        if line_starts is None:
+            line_starts = [0]
+            line_starts.extend(m.end() for m in re.finditer('\n', code))
         
-        # Check 4: Complexity (too complex might hide issues)
-        function_count = sum(1 for node in ast.walk(tree) if isinstance(node, ast.FunctionDef))
-        class_count = sum(1 for node in ast.walk(tree) if isinstance(node, ast.ClassDef))
+        line_num = bisect_right(line_starts, match.start())
+        line_end = line_starts[line_num] if line_num < len(line_starts) else len(code)
+        matched_line = code[line_starts[line_num - 1]:line_end]
         
-        if function_count > 50:
+        # Check if this line uses safe patterns
+        if not SAFE_SECRET_RE.search(matched_line):
             issues.append(ValidationIssue(
-                severity="WARNING",
-                issue_type="quality",
-                message=f"Very high function count: {function_count}",
-                suggestion="Consider breaking into multiple files"
-            ))
-        
-        # Cap risk score at 1.0
-        risk_score = min(risk_score, 1.0)
-        
-        # Determine if code is safe
-        has_errors = any(i.severity == "ERROR" for i in issues)
-        is_safe = not has_errors and risk_score < 0.5
-        
-        logger.info(f"✓ Security validation complete")
-        logger.info(f"  Risk score: {risk_score:.2f}")
-        logger.info(f"  Issues: {len(issues)} ({len([i for i in issues if i.severity == 'ERROR'])} errors)")
-        
-        return ValidationResult(
-            valid=is_safe,
-            issues=issues,
-            risk_score=risk_score,
-            summary=f"Risk score: {risk_score:.2f}, {len(issues)} issues found"
-        )
-        
-    except Exception as e:
-        logger.error(f"Security validation error: {e}")
-        return ValidationResult(
-            valid=False,
-            issues=[ValidationIssue(
                 severity="ERROR",
                 issue_type="security",
-                message=f"Security validation failed: {str(e)}",
-                suggestion="Fix syntax errors first"
-            )],
-            risk_score=1.0,
-            summary=f"Validation failed: {str(e)}"
-        )
+                message=HARDCODED_SECRET_MESSAGES[match.lastgroup],
+                line_number=line_num,
+                suggestion="Use environment variables or config instead"
+            ))
+            risk_score += 0.3
+            error_count += 1
+    
+    # Check 4: Complexity (too complex might hide issues)
+    if visitor.function_count > 50 and not (fail_fast and error_count):
+        issues.append(ValidationIssue(
+            severity="WARNING",
+            issue_type="quality",
+            message=f"Very high function count: {visitor.function_count}",
+            suggestion="Consider breaking into multiple files"
+        ))
+        warning_count += 1
+    
+    # Cap risk score at 1.0
+    risk_score = min(risk_score, 1.0)
+    
+    # Determine if code is safe
+    is_safe = error_count == 0 and risk_score < 0.5
+    
+    logger.info(f"✓ Security validation complete")
+    logger.info(f"  Risk score: {risk_score:.2f}")
+    logger.info(f"  Issues: {len(issues)} ({error_count} errors)")
+    
+    return ValidationResult(
+        valid=is_safe,
+        issues=issues,
+        risk_score=risk_score,
+        summary=f"Risk score: {risk_score:.2f}, {len(issues)} issues found",
+        error_count=error_count,
+        warning_count=warning_count
+    )
+
 
+# Results of validate_code keyed by (source digest, fail_fast), evicted oldest
+# first like _AST_CACHE
+_VALIDATE_CACHE: Dict[tuple, ValidationResult] = {}
+_VALIDATE_CACHE_MAX = 512
 
-def validate_code(code: str) -> ValidationResult:
+
+def validate_code(code: str, fail_fast: bool = False) -> ValidationResult:
     """
     Comprehensive code validation (syntax + security).
     
+    Results are memoized per code string, so retries that regenerate identical
+    code skip re-validation. The returned result is shared; treat it as read-only.
+    
     Args:
         code: Python code as string
+        fail_fast: Stop security validation at the first ERROR (yes/no gating)
     
     Returns:
         Combined validation result
     """
+    key = (_code_digest(code), fail_fast)
+    result = _VALIDATE_CACHE.get(key)
+    if result is None:
+        result = _validate_code_impl(code, fail_fast)
+        with _CACHE_LOCK:
+            if len(_VALIDATE_CACHE) >= _VALIDATE_CACHE_MAX:
+                _VALIDATE_CACHE.pop(next(iter(_VALIDATE_CACHE)), None)
+            _VALIDATE_CACHE[key] = result
+    return result
+
+
+def _validate_code_impl(code: str, fail_fast: bool) -> ValidationResult:
+    """Run syntax and security validation without consulting the cache."""
     logger.info("Running comprehensive code validation...")
     
+    # Parse once and share the tree between both validation steps
+    try:
+        tree = _parse_cached(code)
+    except Exception as e:
+        logger.error("Syntax validation failed, skipping security validation")
+        if isinstance(e, SyntaxError):
+            return _syntax_error_result(e)
+        return _parse_failure_result(e)
+    
     # Step 1: Syntax validation (must pass first)
-    syntax_result = validate_code_syntax(code)
+    logger.info("Validating code syntax...")
+    syntax_result = _validate_syntax(tree, code)
     if not syntax_result.valid:
         logger.error("Syntax validation failed, skipping security validation")
         return syntax_result
     
     # Step 2: Security validation
-    security_result = validate_code_security(code)
+    logger.info("Validating code security...")
+    try:
+        security_result = _validate_security(tree, code, fail_fast)
+    except Exception as e:
+        security_result = _security_failure_result(e)
     
     # Combine results
     all_issues = syntax_result.issues + security_result.issues
@@ -376,10 +559,40 @@ def validate_code(code: str) -> ValidationResult:
         valid=overall_valid,
         issues=all_issues,
         risk_score=security_result.risk_score,
-        summary=f"{'✓ VALID' if overall_valid else '✗ INVALID'} - {len(all_issues)} issues, risk: {security_result.risk_score:.2f}"
+        summary=f"{'✓ VALID' if overall_valid else '✗ INVALID'} - {len(all_issues)} issues, risk: {security_result.risk_score:.2f}",
+        error_count=syntax_result.error_count + security_result.error_count,
+        warning_count=syntax_result.warning_count + security_result.warning_count
     )
     
     logger.info(f"✓ Comprehensive validation complete: {combined_result.summary}")
     
     return combined_result
 
+
+# Worker pool for batch validation, created on first use
+_validation_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _get_validation_pool() -> ProcessPoolExecutor:
+    global _validation_pool
+    if _validation_pool is None:
+        _validation_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+    return _validation_pool
+
+
+def validate_code_many(codes: List[str]) -> List[ValidationResult]:
+    """
+    Validate a batch of independent code snippets across worker processes.
+    
+    Args:
+        codes: Python code snippets as strings
+    
+    Returns:
+        One combined validation result per snippet, in input order
+    """
+    if len(codes) < 2:
+        return [validate_code(code) for code in codes]
+    
+    # Larger chunks amortize pickling overhead for small snippets
+    chunksize = max(1, len(codes) // (4 * (os.cpu_count() or 1)))
+    return list(_get_validation_pool().map(validate_code, codes, chunksize=chunksize))
@@ -1,7 +1,9 @@
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 from loguru import logger
+import numpy as np
 import pandas as pd
 
 class MissingDataError(Exception):
@@ -12,14 +14,36 @@ class InvalidDataError(Exception):
     """Exception raised when invalid data is provided for calculation."""
     pass
 
+# Schema for property data at external API boundaries; the calculation methods
+# coerce the two fields directly instead of building a model per call.
 class PropertyData(BaseModel):
     rental_income: float
     debt_payments: float
 
+_LOG_CONFIGURED = False
+
+def _configure_logging():
+    """Registers the log file sink once per process, not once per agent instance."""
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED:
+        return
+    logger.add(os.getenv('LOG_FILE', 'calc_agent.log'), level=os.getenv('LOG_LEVEL', 'INFO'))
+    _LOG_CONFIGURED = True
+
+def _require_positive(rental_income: float, debt_payments: float) -> None:
+    if rental_income <= 0.0 or debt_payments <= 0.0:
+        logger.error("Invalid data provided for calculation.")
+        raise InvalidDataError("Invalid data provided for calculation.")
+
+@lru_cache(maxsize=4096)
+def _debt_coverage_ratio(rental_income: float, debt_payments: float) -> float:
+    """Validated debt coverage ratio, memoized for repeated (income, debt) pairs."""
+    _require_positive(rental_income, debt_payments)
+    return rental_income / debt_payments
+
 class CalcAgent:
     def __init__(self):
-        self.logger = logger
-        self.logger.add(os.getenv('LOG_FILE', 'calc_agent.log'), level=os.getenv('LOG_LEVEL', 'INFO'))
+        _configure_logging()
 
     def calculate_debt_coverage_ratio(self, property_data: Dict[str, Any]) -> float:
         """
@@ -35,18 +59,8 @@ class CalcAgent:
             MissingDataError: If required data is missing.
             InvalidDataError: If invalid data is provided for calculation.
         """
-        try:
-            property_data = PropertyData(**property_data)
-        except ValidationError as e:
-            self.logger.error(f"Invalid data provided for calculation: {e}")
-            raise InvalidDataError("Invalid data provided for calculation.") from e
-        
-        if property_data.rental_income <= 0 or property_data.debt_payments <= 0:
-            self.logger.error("Invalid data provided for calculation.")
-            raise InvalidDataError("Invalid data provided for calculation.")
-        
-        debt_coverage_ratio = property_data.rental_income / property_data.debt_payments
-        return debt_coverage_ratio
+        rental_income, debt_payments = self._property_values(property_data)
+        return _debt_coverage_ratio(rental_income, debt_payments)
 
     def check_rental_coverage(self, property_data: Dict[str, Any]) -> bool:
         """
@@ -62,18 +76,75 @@ class CalcAgent:
             MissingDataError: If required data is missing.
             InvalidDataError: If invalid data is provided for calculation.
         """
+        rental_income, debt_payments = self._property_values(property_data)
+        _require_positive(rental_income, debt_payments)
+        
+        is_covered = rental_income >= debt_payments
+        return is_covered
+
+    def _property_values(self, property_data: Dict[str, Any]):
+        """Extracts rental income and debt payments as floats."""
         try:
-            property_data = PropertyData(**property_data)
-        except ValidationError as e:
-            self.logger.error(f"Invalid data provided for calculation: {e}")
+            rental_income = float(property_data["rental_income"])
+            debt_payments = float(property_data["debt_payments"])
+        except (KeyError, TypeError, ValueError) as e:
+            logger.error(f"Invalid data provided for calculation: {e!r}")
             raise InvalidDataError("Invalid data provided for calculation.") from e
         
-        if property_data.rental_income <= 0 or property_data.debt_payments <= 0:
-            self.logger.error("Invalid data provided for calculation.")
+        return rental_income, debt_payments
+
+    def calculate_debt_coverage_ratios(self, incomes: Any, debts: Any) -> np.ndarray:
+        """
+        Calculates the debt coverage ratio for many properties in one vectorized pass.
+        
+        Args:
+            incomes (array-like): Rental income per property.
+            debts (array-like): Debt payments per property, aligned with incomes.
+        
+        Returns:
+            np.ndarray: The debt coverage ratio for each property.
+        
+        Raises:
+            InvalidDataError: If invalid data is provided for calculation.
+        """
+        incomes, debts = self._to_batch_arrays(incomes, debts)
+        return incomes / debts
+
+    def check_rental_coverage_batch(self, incomes: Any, debts: Any) -> np.ndarray:
+        """
+        Checks, for many properties at once, if rental income covers debt payments.
+        
+        Args:
+            incomes (array-like): Rental income per property.
+            debts (array-like): Debt payments per property, aligned with incomes.
+        
+        Returns:
+            np.ndarray: Boolean array, True where rental income covers debt payments.
+        
+        Raises:
+            InvalidDataError: If invalid data is provided for calculation.
+        """
+        incomes, debts = self._to_batch_arrays(incomes, debts)
+        return incomes >= debts
+
+    def _to_batch_arrays(self, incomes: Any, debts: Any):
+        """Coerces batch inputs to aligned float64 arrays of positive values."""
+        try:
+            incomes = np.asarray(incomes, dtype=np.float64)
+            debts = np.asarray(debts, dtype=np.float64)
+        except (TypeError, ValueError) as e:
+            logger.error(f"Invalid data provided for calculation: {e}")
+            raise InvalidDataError("Invalid data provided for calculation.") from e
+        
+        if incomes.shape != debts.shape:
+            logger.error("Invalid data provided for calculation: incomes and debts are not aligned.")
             raise InvalidDataError("Invalid data provided for calculation.")
         
-        is_covered = property_data.rental_income >= property_data.debt_payments
-        return is_covered
+        if (incomes <= 0).any() or (debts <= 0).any():
+            logger.error("Invalid data provided for calculation.")
+            raise InvalidDataError("Invalid data provided for calculation.")
+        
+        return incomes, debts
 
 # Example usage:
 if __name__ == "__main__":
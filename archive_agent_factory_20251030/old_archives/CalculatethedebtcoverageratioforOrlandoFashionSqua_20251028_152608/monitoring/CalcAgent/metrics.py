@@ -3,50 +3,88 @@ Metrics collector for CalcAgent
 """
 
 import time
+import threading
 from typing import Dict, Any
 from loguru import logger
 
 
+_METRIC_KEYS = (
+    "requests_total",
+    "requests_success",
+    "requests_failed",
+    "execution_time_total",
+    "last_execution_time",
+    "success_rate",
+    "avg_execution_time"
+)
+
+# Static TYPE headers and metric names are rendered once; only values vary per scrape
+_PROMETHEUS_TEMPLATE = "\n".join(
+    f"# TYPE calcagent_{key} gauge\ncalcagent_{key} %s" for key in _METRIC_KEYS
+)
+
+
 class MetricsCollector:
     """Collect and expose agent metrics"""
     
+    __slots__ = (
+        "_lock",
+        "requests_total",
+        "requests_success",
+        "requests_failed",
+        "execution_time_total",
+        "last_execution_time"
+    )
+    
     def __init__(self):
-        self.metrics = {
-            "requests_total": 0,
-            "requests_success": 0,
-            "requests_failed": 0,
-            "execution_time_total": 0.0,
-            "last_execution_time": 0.0
-        }
+        self._lock = threading.Lock()
+        self.requests_total = 0
+        self.requests_success = 0
+        self.requests_failed = 0
+        self.execution_time_total = 0.0
+        self.last_execution_time = 0.0
     
     def record_request(self, success: bool, duration: float):
-        """Record a request execution"""
-        self.metrics["requests_total"] += 1
-        
-        if success:
-            self.metrics["requests_success"] += 1
-        else:
-            self.metrics["requests_failed"] += 1
-        
-        self.metrics["execution_time_total"] += duration
-        self.metrics["last_execution_time"] = duration
+        """Record a request execution (safe to call from multiple threads)"""
+        with self._lock:
+            self.requests_total += 1
+            
+            if success:
+                self.requests_success += 1
+            else:
+                self.requests_failed += 1
+            
+            self.execution_time_total += duration
+            self.last_execution_time = duration
     
     def get_metrics(self) -> Dict[str, Any]:
         """Get current metrics"""
+        # Snapshot under the lock so the counters are mutually consistent
+        with self._lock:
+            requests_total = self.requests_total
+            requests_success = self.requests_success
+            requests_failed = self.requests_failed
+            execution_time_total = self.execution_time_total
+            last_execution_time = self.last_execution_time
+        
         success_rate = (
-            self.metrics["requests_success"] / self.metrics["requests_total"] * 100
-            if self.metrics["requests_total"] > 0
+            requests_success / requests_total * 100
+            if requests_total > 0
             else 0.0
         )
         
         avg_execution_time = (
-            self.metrics["execution_time_total"] / self.metrics["requests_total"]
-            if self.metrics["requests_total"] > 0
+            execution_time_total / requests_total
+            if requests_total > 0
             else 0.0
         )
         
         return {
-            **self.metrics,
+            "requests_total": requests_total,
+            "requests_success": requests_success,
+            "requests_failed": requests_failed,
+            "execution_time_total": execution_time_total,
+            "last_execution_time": last_execution_time,
             "success_rate": success_rate,
             "avg_execution_time": avg_execution_time
         }
@@ -54,14 +92,7 @@ class MetricsCollector:
     def export_prometheus_format(self) -> str:
         """Export metrics in Prometheus format"""
         metrics = self.get_metrics()
-        
-        output = []
-        for key, value in metrics.items():
-            metric_name = f"calcagent_{key}"
-            output.append(f"# TYPE {metric_name} gauge")
-            output.append(f"{metric_name} {value}")
-        
-        return "\n".join(output)
+        return _PROMETHEUS_TEMPLATE % tuple(metrics[key] for key in _METRIC_KEYS)
 
 
 # Global metrics collector instance
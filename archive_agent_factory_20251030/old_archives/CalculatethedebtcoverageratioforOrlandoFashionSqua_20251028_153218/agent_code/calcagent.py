@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from typing import Dict, Any, Optional
-from pydantic import BaseModel, ValidationError
+from pydantic import BaseModel
 from loguru import logger
 import numpy as np
 
@@ -10,44 +11,100 @@ class MissingDataError(Exception):
 class InvalidDataError(Exception):
     pass
 
+# Schema for property data at external API boundaries; the calculation methods
+# coerce the two fields directly instead of building a model per call.
 class PropertyData(BaseModel):
     rental_income: float
     debt_payments: float
 
+_LOG_CONFIGURED = False
+
+def _configure_logging(level: str):
+    global _LOG_CONFIGURED
+    if _LOG_CONFIGURED:
+        return
+    logger.add(os.getenv('LOG_FILE', 'calc_agent.log'), level=level)
+    _LOG_CONFIGURED = True
+
+def _debt_coverage_ratio(rental_income: float, debt_payments: float) -> float:
+    try:
+        return rental_income / debt_payments
+    except ZeroDivisionError as e:
+        logger.error("InvalidDataError: Invalid data provided for calculation.")
+        raise InvalidDataError("Invalid data provided for calculation.") from e
+
+# Memoized for repeated (income, debt) pairs; used when CACHE_ENABLED is true
+_cached_debt_coverage_ratio = lru_cache(maxsize=4096)(_debt_coverage_ratio)
+
+def _read_config() -> Dict[str, Any]:
+    return {
+        'agent_name': os.getenv('AGENT_NAME', 'CalcAgent'),
+        'version': os.getenv('VERSION', '1.0.0'),
+        'description': os.getenv('DESCRIPTION', 'CalcAgent is a primary agent designed to calculate the debt coverage ratio for properties and check if rental income covers debt payments.'),
+        'role': os.getenv('ROLE', 'primary_agent'),
+        'timeout_seconds': int(os.getenv('TIMEOUT_SECONDS', 10)),
+        'cache_enabled': os.getenv('CACHE_ENABLED', 'true').lower() == 'true',
+        'logging_level': os.getenv('LOGGING_LEVEL', 'INFO'),
+    }
+
+# Environment is read once at import; call CalcAgent.reload_config() to re-read it
+_CONFIG = _read_config()
+
 class CalcAgent:
     def __init__(self):
-        self.agent_name = os.getenv('AGENT_NAME', 'CalcAgent')
-        self.version = os.getenv('VERSION', '1.0.0')
-        self.description = os.getenv('DESCRIPTION', 'CalcAgent is a primary agent designed to calculate the debt coverage ratio for properties and check if rental income covers debt payments.')
-        self.role = os.getenv('ROLE', 'primary_agent')
-        self.timeout_seconds = int(os.getenv('TIMEOUT_SECONDS', 10))
-        self.cache_enabled = os.getenv('CACHE_ENABLED', 'true').lower() == 'true'
-        self.logging_level = os.getenv('LOGGING_LEVEL', 'INFO')
-        logger.add(os.getenv('LOG_FILE', 'calc_agent.log'), level=self.logging_level)
+        self.agent_name = _CONFIG['agent_name']
+        self.version = _CONFIG['version']
+        self.description = _CONFIG['description']
+        self.role = _CONFIG['role']
+        self.timeout_seconds = _CONFIG['timeout_seconds']
+        self.cache_enabled = _CONFIG['cache_enabled']
+        self.logging_level = _CONFIG['logging_level']
+        _configure_logging(self.logging_level)
+
+    @classmethod
+    def reload_config(cls) -> None:
+        _CONFIG.update(_read_config())
 
     def calculate_debt_coverage_ratio(self, property_data: Dict[str, Any]) -> float:
+        rental_income, debt_payments = self._property_values(property_data)
+        if self.cache_enabled:
+            return _cached_debt_coverage_ratio(rental_income, debt_payments)
+        return _debt_coverage_ratio(rental_income, debt_payments)
+
+    def check_rental_coverage(self, property_data: Dict[str, Any]) -> bool:
+        rental_income, debt_payments = self._property_values(property_data)
+        is_covered = rental_income >= debt_payments
+        return is_covered
+
+    def _property_values(self, property_data: Dict[str, Any]):
         try:
-            data = PropertyData(**property_data)
-            debt_coverage_ratio = data.rental_income / data.debt_payments
-            return debt_coverage_ratio
-        except (ValidationError, KeyError) as e:
+            return float(property_data["rental_income"]), float(property_data["debt_payments"])
+        except (KeyError, TypeError, ValueError) as e:
             logger.error("MissingDataError: Property data is missing required fields.")
             raise MissingDataError("Property data is missing required fields.") from e
-        except ZeroDivisionError as e:
+
+    def calculate_debt_coverage_ratios(self, incomes: Any, debts: Any) -> np.ndarray:
+        incomes, debts = self._to_batch_arrays(incomes, debts)
+        if (debts == 0).any():
             logger.error("InvalidDataError: Invalid data provided for calculation.")
-            raise InvalidDataError("Invalid data provided for calculation.") from e
+            raise InvalidDataError("Invalid data provided for calculation.")
+        return incomes / debts
 
-    def check_rental_coverage(self, property_data: Dict[str, Any]) -> bool:
+    def check_rental_coverage_batch(self, incomes: Any, debts: Any) -> np.ndarray:
+        incomes, debts = self._to_batch_arrays(incomes, debts)
+        return incomes >= debts
+
+    def _to_batch_arrays(self, incomes: Any, debts: Any):
         try:
-            data = PropertyData(**property_data)
-            is_covered = data.rental_income >= data.debt_payments
-            return is_covered
-        except (ValidationError, KeyError) as e:
+            incomes = np.asarray(incomes, dtype=np.float64)
+            debts = np.asarray(debts, dtype=np.float64)
+        except (TypeError, ValueError) as e:
             logger.error("MissingDataError: Property data is missing required fields.")
             raise MissingDataError("Property data is missing required fields.") from e
-        except Exception as e:
-            logger.error("InvalidDataError: Invalid data provided for calculation.")
-            raise InvalidDataError("Invalid data provided for calculation.") from e
+        if incomes.shape != debts.shape:
+            logger.error("MissingDataError: Property data is missing required fields.")
+            raise MissingDataError("Property data is missing required fields.")
+        return incomes, debts
 
 # Example usage
 if __name__ == "__main__":
@@ -10,7 +10,18 @@ import sys
 from pathlib import Path
 from loguru import logger
 from datetime import datetime
-import json
+
+# orjson serializes straight to UTF-8 bytes; fall back to the stdlib if absent
+try:
+    import orjson
+    
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    import json
+    
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
 
 # Add agents to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -78,8 +89,8 @@ class SystemOrchestrator:
         # Ensure results directory exists
         Path(output_file).parent.mkdir(parents=True, exist_ok=True)
         
-        with open(output_file, 'w') as f:
-            json.dump(results, f, indent=2)
+        with open(output_file, 'wb', buffering=1 << 20) as f:
+            f.write(_dumps(results))
         
         logger.info(f"Results saved to: {output_file}")
         return output_file
@@ -92,11 +103,11 @@ def main():
     orchestrator = SystemOrchestrator()
     
     # Get input from environment or use defaults
-    input_params = {}
-    for key in os.environ:
-        if key.startswith("INPUT_"):
-            param_name = key.replace("INPUT_", "").lower()
-            input_params[param_name] = os.getenv(key)
+    input_params = {
+        key[len("INPUT_"):].lower(): value
+        for key, value in os.environ.items()
+        if key.startswith("INPUT_")
+    }
     
     # If no inputs provided, use defaults
     if not input_params:
@@ -7,18 +7,39 @@ import sys
 from loguru import logger
 
 
-def check_database_connection():
-    """Check if database is accessible"""
-    try:
-        import psycopg2
-        conn = psycopg2.connect(
+# Connection pool shared by repeated health checks in the same process
+_pool = None
+
+
+def _get_pool():
+    """Create the connection pool on first use"""
+    global _pool
+    if _pool is None:
+        from psycopg2.pool import ThreadedConnectionPool
+        _pool = ThreadedConnectionPool(
+            1, 4,
             dbname=os.getenv('DB_NAME'),
             user=os.getenv('DB_USER'),
             password=os.getenv('DB_PASSWORD'),
             host=os.getenv('DB_HOST'),
             port=os.getenv('DB_PORT')
         )
-        conn.close()
+    return _pool
+
+
+def check_database_connection():
+    """Check if database is accessible"""
+    try:
+        pool = _get_pool()
+        conn = pool.getconn()
+        try:
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+        except Exception:
+            # Drop the broken connection instead of returning it to the pool
+            pool.putconn(conn, close=True)
+            raise
+        pool.putconn(conn)
         return True
     except Exception as e:
         logger.error(f"Database check failed: {e}")
@@ -0,0 +1 @@
+"""Archived setup and validation checks"""
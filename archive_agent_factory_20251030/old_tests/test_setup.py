@@ -2,26 +2,21 @@
 Test Setup Script
 Verifies that all components are properly configured.
 NO FALLBACKS - Will fail clearly if any component is missing.
+
+Run from the project root so meta_agent and config resolve as packages:
+    python -m archive_agent_factory_20251030.old_tests.test_setup
 """
 
 import sys
-from pathlib import Path
-
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from loguru import logger
-import httpx
-from sqlalchemy import create_engine, text
+
+from meta_agent.utils.logging_setup import configure_logger
 
 # Configure logger
-logger.remove()
-logger.add(
-    sys.stdout,
-    colorize=True,
-    format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-    level="INFO"
-)
+configure_logger()
 
 
 def test_configuration():
@@ -45,23 +40,38 @@ def test_configuration():
         return False
 
 
+@lru_cache(maxsize=1)
+def _probe_llm(base_url: str, model: str) -> None:
+    """
+    Check in one request that LM Studio answers and has the model loaded.
+    
+    Only success is cached: an unreachable server raises ConnectionError and
+    a missing model raises RuntimeError, so a later call probes again.
+    """
+    import httpx
+    
+    try:
+        response = httpx.get(f"{base_url}/models", timeout=2.0)
+        response.raise_for_status()
+    except httpx.HTTPError as e:
+        raise ConnectionError(f"Cannot reach LM Studio at {base_url}: {e}") from e
+    
+    if not any(m.get("id") == model for m in response.json().get("data", [])):
+        raise RuntimeError(f"Model '{model}' is not loaded in LM Studio")
+
+
 def test_llm_connection():
     """Test connection to LM Studio"""
     logger.info("\nTesting LM Studio connection...")
     
     try:
         from config import settings
-        from meta_agent.utils.llm_client import LLMClient
         
-        # Initialize client (will test connection)
-        client = LLMClient()
-        
-        # Run health check
-        client.verify_health()
+        _probe_llm(settings.llm_base_url, settings.llm_model_name)
         
         logger.info(f"✓ LM Studio connected successfully")
-        logger.info(f"  Model: {client.model_name}")
-        logger.info(f"  Temperature: {client.temperature}")
+        logger.info(f"  Model: {settings.llm_model_name}")
+        logger.info(f"  Temperature: {settings.llm_temperature}")
         
         return True
         
@@ -79,16 +89,39 @@ def test_llm_connection():
         return False
 
 
+_ENGINE = None
+
+
+def _get_engine():
+    """Return the shared database engine, creating it on first use"""
+    global _ENGINE
+    if _ENGINE is None:
+        from sqlalchemy import create_engine
+        from sqlalchemy.pool import NullPool
+        from config import settings
+        
+        # One-shot health check: skip pool setup and fail fast on a dead host
+        _ENGINE = create_engine(
+            settings.database_url,
+            poolclass=NullPool,
+            connect_args={"connect_timeout": 3}
+        )
+    return _ENGINE
+
+
 def test_database_connection():
     """Test connection to PostgreSQL"""
     logger.info("\nTesting PostgreSQL connection...")
     
     try:
-        from config import settings
+        from sqlalchemy import text
         
-        engine = create_engine(settings.database_url)
+        engine = _get_engine()
         
         with engine.connect() as conn:
+            # Check the server answers before touching application tables
+            conn.execute(text("SELECT 1"))
+            
             # Test query
             result = conn.execute(text("SELECT COUNT(*) as count FROM properties"))
             count = result.fetchone()[0]
@@ -164,13 +197,23 @@ def main():
     logger.info("META-AGENT SETUP VERIFICATION")
     logger.info("="*70)
     
-    results = {
-        "Configuration": test_configuration(),
-        "LM Studio": test_llm_connection(),
-        "PostgreSQL": test_database_connection(),
-        "Docker": test_docker(),
-        "Tool Imports": test_tool_imports()
-    }
+    # LM Studio, PostgreSQL and Docker are independent services, so probe them
+    # concurrently while the import-driven checks run on the main thread
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        llm_future = executor.submit(test_llm_connection)
+        db_future = executor.submit(test_database_connection)
+        docker_future = executor.submit(test_docker)
+        
+        configuration_ok = test_configuration()
+        tool_imports_ok = test_tool_imports()
+        
+        results = {
+            "Configuration": configuration_ok,
+            "LM Studio": llm_future.result(),
+            "PostgreSQL": db_future.result(),
+            "Docker": docker_future.result(),
+            "Tool Imports": tool_imports_ok
+        }
     
     logger.info("\n" + "="*70)
     logger.info("TEST RESULTS")
@@ -1,35 +1,77 @@
 """
 Simple Example: Test the Meta-Agent Tools
 Demonstrates the complete pipeline for generating a simple DSCR agent.
+
+Run from the project root so meta_agent and config resolve as packages:
+    python -m archive_agent_factory_20251030.simple_example_agent_factory
 """
 
+import itertools
+import string
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add project root to path
-sys.path.insert(0, str(Path(__file__).parent))
-
 from loguru import logger
-from meta_agent.utils.llm_client import LLMClient
-from meta_agent.tools.analyze_requirements import analyze_requirements, validate_requirements
-from meta_agent.tools.design_agent_architecture import design_agent_architecture, validate_architecture
-from meta_agent.tools.generate_agent_specification import generate_agent_specification_with_retry, validate_specification_structure
-from meta_agent.tools.generate_agent_code import generate_agent_code_with_retry
-from meta_agent.validators.code_validator import validate_code
-from meta_agent.tools.file_operations import write_agent_files
-from meta_agent.tools.deploy_multi_agent_system import deploy_multi_agent_system
-from meta_agent.tools.monitor_agent import setup_agent_monitoring, MonitoringConfig
-from meta_agent.utils.archive_manager import archive_workflow_results
-import yaml
+
+from meta_agent.utils.logging_setup import configure_logger
+
+# Tool modules are imported inside main() at the step that first needs them,
+# so a failure in an early step does not pay the import cost of later ones.
 
 # Configure logger
-logger.remove()
-logger.add(
-    sys.stdout,
-    colorize=True,
-    format="<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>",
-    level="INFO"
-)
+configure_logger()
+
+# Deletes every ASCII character that may not appear in a system name
+_SYSTEM_NAME_KEEP = frozenset(string.ascii_letters + string.digits + '-')
+_SYSTEM_NAME_DELETE = str.maketrans("", "", "".join(
+    c for c in map(chr, range(128)) if c not in _SYSTEM_NAME_KEEP
+))
+
+# Upper bound on worker threads for the per-agent steps 6, 7 and 9
+MAX_AGENT_WORKERS = 8
+
+
+def _map_in_threads(func, items):
+    """Apply func to each of items in a thread pool, preserving input order"""
+    items = list(items)
+    with ThreadPoolExecutor(max_workers=max(1, min(MAX_AGENT_WORKERS, len(items)))) as executor:
+        return list(executor.map(func, items))
+
+
+def _preflight(user_request: str) -> str:
+    """
+    Check the request, settings and LM Studio before any expensive step.
+    
+    Returns:
+        The stripped user request
+    
+    Raises:
+        ValueError: If the request or a required setting is missing
+        ConnectionError: If LM Studio does not answer
+    """
+    user_request = user_request.strip()
+    if len(user_request) <= 10:
+        raise ValueError(
+            f"Pre-flight validation failed at path: user_request "
+            f"(expected more than 10 characters, got {len(user_request)})"
+        )
+    
+    from config import settings
+    for field in ("llm_base_url", "database_url"):
+        if not getattr(settings, field, None):
+            raise ValueError(f"Pre-flight validation failed at path: settings.{field} (not set)")
+    
+    import httpx
+    try:
+        httpx.get(f"{settings.llm_base_url}/models", timeout=2.0).raise_for_status()
+    except httpx.HTTPError as e:
+        raise ConnectionError(
+            f"Pre-flight validation failed at path: settings.llm_base_url "
+            f"(LM Studio not reachable at {settings.llm_base_url}: {e})"
+        ) from e
+    
+    return user_request
 
 
 def main():
@@ -48,50 +90,64 @@ Give me a clear recommendation.
     logger.info(f"\nUser Request:\n{user_request}\n")
     
     try:
+        # Step 0: Pre-flight checks
+        logger.info("STEP 0: Running Pre-flight Checks...")
+        user_request = _preflight(user_request)
+        logger.info("✓ Pre-flight checks passed\n")
+        
         # Step 1: Initialize LLM Client
         logger.info("STEP 1: Initializing LLM Client...")
+        from meta_agent.utils.llm_client import LLMClient, map_llm_calls
         llm_client = LLMClient()
         logger.info("✓ LLM Client ready\n")
         
         # Step 2: Analyze Requirements
         logger.info("STEP 2: Analyzing Requirements...")
+        from meta_agent.tools.analyze_requirements import analyze_requirements, validate_requirements
         requirements = analyze_requirements(user_request, llm_client)
         validate_requirements(requirements)
         logger.info(f"✓ Requirements analyzed")
         logger.info(f"  Primary Goal: {requirements.primary_goal}")
-        logger.info(f"  Agents Needed: {', '.join(requirements.required_agents)}")
+        logger.opt(lazy=True).info("  Agents Needed: {}", lambda: ', '.join(requirements.required_agents))
         logger.info(f"  Complexity: {requirements.complexity}\n")
         
         # Step 3: Design Architecture
         logger.info("STEP 3: Designing Architecture...")
+        from meta_agent.tools.design_agent_architecture import design_agent_architecture, validate_architecture
         architecture = design_agent_architecture(requirements, llm_client)
         validate_architecture(architecture)
         logger.info(f"✓ Architecture designed")
-        logger.info(f"  Agents: {len(architecture.agents)}")
+        logger.opt(lazy=True).info("  Agents: {}", lambda: len(architecture.agents))
         for agent in architecture.agents:
             logger.info(f"    - {agent.agent_name} ({agent.role}, {agent.complexity})")
         logger.info(f"  Orchestrator Needed: {not architecture.no_orchestrator_needed}\n")
         
         # Step 4: Generate Specifications
         logger.info("STEP 4: Generating Specifications...")
+        from meta_agent.tools.generate_agent_specification import generate_all_specifications, validate_specification_structure
+        
+        # One batched request covers every agent; only agents whose document
+        # came back unusable are regenerated individually
+        spec_results = generate_all_specifications(
+            architecture=architecture,
+            requirements=requirements,
+            llm_client=llm_client
+        )
         specifications = {}
-        for agent_design in architecture.agents:
-            logger.info(f"  Generating spec for {agent_design.agent_name}...")
-            yaml_spec = generate_agent_specification_with_retry(
-                agent_design=agent_design,
-                architecture=architecture,
-                requirements=requirements,
-                llm_client=llm_client
-            )
-            validate_specification_structure(yaml_spec)
-            specifications[agent_design.agent_name] = yaml_spec
-            logger.info(f"  ✓ {agent_design.agent_name} spec generated ({len(yaml_spec)} chars)")
+        spec_dicts = {}
+        for agent_name, (yaml_spec, spec_dict) in spec_results.items():
+            validate_specification_structure(spec_dict)
+            logger.opt(lazy=True).info(f"  ✓ {agent_name} spec generated ({{}} chars)", lambda: len(yaml_spec))
+            specifications[agent_name] = yaml_spec
+            spec_dicts[agent_name] = spec_dict
         logger.info(f"✓ All specifications generated\n")
         
         # Step 5: Generate Code
         logger.info("STEP 5: Generating Code...")
-        generated_code = {}
-        for agent_name, yaml_spec in specifications.items():
+        from meta_agent.tools.generate_agent_code import generate_agent_code_with_retry
+        
+        def generate_code(item):
+            agent_name, yaml_spec = item
             logger.info(f"  Generating code for {agent_name}...")
             result = generate_agent_code_with_retry(yaml_spec, llm_client, max_retries=5)
             code = result["code"]
@@ -99,31 +155,46 @@ Give me a clear recommendation.
             retry_count = result.get("retry_count", 0)
             if retry_count > 0:
                 logger.info(f"    (Required {retry_count} retries)")
-            generated_code[agent_name] = {
+            logger.info(f"  ✓ {agent_name} code generated ({metadata['lines']} lines)")
+            return {
                 "code": code,
                 "specification": yaml_spec,
                 "metadata": metadata
             }
-            logger.info(f"  ✓ {agent_name} code generated ({metadata['lines']} lines)")
+        
+        code_results = map_llm_calls(generate_code, specifications.items())
+        generated_code = dict(zip(specifications, code_results))
+        
+        # Steps 8 and 9 both read the spec parsed during Step 4
+        for agent_name, data in generated_code.items():
+            data["spec_dict"] = spec_dicts[agent_name]
         logger.info(f"✓ All code generated\n")
         
         # Step 6: Validate Code
         logger.info("STEP 6: Validating Code...")
-        validation_results = {}
-        for agent_name, data in generated_code.items():
+        from meta_agent.validators.code_validator import validate_code
+        
+        def validate_agent(item):
+            agent_name, data = item
             logger.info(f"  Validating {agent_name}...")
-            validation = validate_code(data["code"])
-            validation_results[agent_name] = validation
-            
+            return validate_code(data["code"])
+        
+        validation_results = dict(zip(
+            generated_code,
+            _map_in_threads(validate_agent, generated_code.items())
+        ))
+        
+        # Report in agent order once every check has finished
+        for agent_name, validation in validation_results.items():
             if validation.valid:
                 logger.info(f"  ✓ {agent_name} validation PASSED")
                 logger.info(f"    Risk Score: {validation.risk_score:.2f}")
-                logger.info(f"    Issues: {len(validation.issues)}")
+                logger.opt(lazy=True).info("    Issues: {}", lambda: len(validation.issues))
             else:
                 logger.error(f"  ✗ {agent_name} validation FAILED")
                 logger.error(f"    Risk Score: {validation.risk_score:.2f}")
-                logger.error(f"    Issues: {len(validation.issues)}")
-                for issue in validation.issues[:3]:  # Show first 3 issues
+                logger.opt(lazy=True).error("    Issues: {}", lambda: len(validation.issues))
+                for issue in itertools.islice(validation.issues, 3):  # Show first 3 issues
                     logger.error(f"      - {issue.severity}: {issue.message}")
         
         # Check if all passed
@@ -136,69 +207,88 @@ Give me a clear recommendation.
         
         # Step 7: Write Files
         logger.info("STEP 7: Writing Files...")
-        written_files = {}
-        for agent_name, data in generated_code.items():
+        from meta_agent.tools.file_operations import write_agent_files
+        
+        def write_agent(item):
+            agent_name, data = item
             logger.info(f"  Writing files for {agent_name}...")
             files = write_agent_files(
                 agent_name=agent_name,
                 code=data["code"],
                 specification=data["specification"]
             )
-            written_files[agent_name] = files
             logger.info(f"  ✓ {agent_name} files written")
+            return files
+        
+        written_files = dict(zip(
+            generated_code,
+            _map_in_threads(write_agent, generated_code.items())
+        ))
         
         logger.info(f"✓ All files written\n")
         
         # Step 8: Deploy All Agents (Single Container)
         logger.info("STEP 8: Deploying Agent System (Single Container)...")
+        from meta_agent.tools.deploy_multi_agent_system import deploy_multi_agent_system
         
         # Prepare agents data for deployment
         agents_for_deployment = {}
         for agent_name, data in generated_code.items():
             agents_for_deployment[agent_name] = {
                 'code_path': written_files[agent_name]["code"],
-                'spec': yaml.safe_load(data["specification"])
+                'spec': data["spec_dict"]
             }
         
         # Determine system name from requirements or use default
         system_name = requirements.primary_goal.lower().replace(" ", "-")[:30] + "-system"
-        system_name = "".join(c for c in system_name if c.isalnum() or c == '-')
+        if system_name.isascii():
+            system_name = system_name.translate(_SYSTEM_NAME_DELETE)
+        else:
+            system_name = "".join(c for c in system_name if c.isalnum() or c == '-')
+        
+        deployment_dir = Path("deployment") / system_name
         
         # Deploy all agents in single container
         deployment_result = deploy_multi_agent_system(
             system_name=system_name,
             agents=agents_for_deployment,
-            output_dir=Path(f"deployment/{system_name}")
+            output_dir=deployment_dir
         )
         
         logger.info(f"  ✓ System deployed: {deployment_result.container_name}")
-        logger.info(f"    Agents: {', '.join(deployment_result.agents_deployed)}")
-        logger.info(f"    Artifacts: {len(deployment_result.artifacts)} files")
+        logger.opt(lazy=True).info("    Agents: {}", lambda: ', '.join(deployment_result.agents_deployed))
+        logger.opt(lazy=True).info("    Artifacts: {} files", lambda: len(deployment_result.artifacts))
         logger.info(f"✓ Single-container deployment complete\n")
         
         # Step 9: Setup Monitoring
         logger.info("STEP 9: Setting Up Monitoring...")
-        monitoring_results = {}
-        for agent_name, data in generated_code.items():
+        from meta_agent.tools.monitor_agent import setup_agent_monitoring
+        monitoring_root = Path("monitoring")
+        
+        def monitor_agent(item):
+            agent_name, data = item
             logger.info(f"  Setting up monitoring for {agent_name}...")
             
-            # Parse YAML spec
-            spec_dict = yaml.safe_load(data["specification"])
-            
             # Setup monitoring
             monitoring = setup_agent_monitoring(
                 agent_name=agent_name,
-                agent_spec=spec_dict,
-                output_dir=Path(f"monitoring/{agent_name}")
+                agent_spec=data["spec_dict"],
+                output_dir=monitoring_root / agent_name
             )
-            monitoring_results[agent_name] = monitoring
             logger.info(f"  ✓ {agent_name} monitoring configured")
-            logger.info(f"    Files created: {len(monitoring.monitoring_files)}")
+            logger.opt(lazy=True).info("    Files created: {}", lambda: len(monitoring.monitoring_files))
+            return monitoring
+        
+        monitoring_results = dict(zip(
+            generated_code,
+            _map_in_threads(monitor_agent, generated_code.items())
+        ))
         
         logger.info(f"✓ All monitoring configured\n")
         
         # Step 10: Archive Results
         logger.info("STEP 10: Archiving Results...")
+        from meta_agent.utils.archive_manager import archive_workflow_results
         
         # Determine archive name from requirements
         archive_name = requirements.primary_goal[:60].strip()
@@ -220,7 +310,7 @@ Give me a clear recommendation.
         logger.info("="*70)
         logger.info("✓ GENERATION, DEPLOYMENT, MONITORING & ARCHIVING COMPLETE")
         logger.info("="*70)
-        logger.info(f"\nGenerated Agents: {len(generated_code)}")
+        logger.opt(lazy=True).info("\nGenerated Agents: {}", lambda: len(generated_code))
         for agent_name, data in generated_code.items():
             logger.info(f"\n{agent_name}:")
             logger.info(f"  Lines of Code: {data['metadata']['lines']}")
@@ -230,16 +320,16 @@ Give me a clear recommendation.
             for file_type, path in written_files[agent_name].items():
                 logger.info(f"    - {file_type}: {path}")
             logger.info(f"  Monitoring:")
-            logger.info(f"    - Files: {len(monitoring_results[agent_name].monitoring_files)}")
+            logger.opt(lazy=True).info("    - Files: {}", lambda: len(monitoring_results[agent_name].monitoring_files))
             if monitoring_results[agent_name].monitoring_files:
                 logger.info(f"    - First file: {monitoring_results[agent_name].monitoring_files[0]}")
         
         logger.info("\n" + "="*70)
         logger.info("Deployment Summary (Single Container):")
         logger.info(f"  Container: {deployment_result.container_name}")
-        logger.info(f"  Agents: {', '.join(deployment_result.agents_deployed)}")
+        logger.opt(lazy=True).info("  Agents: {}", lambda: ', '.join(deployment_result.agents_deployed))
         logger.info(f"  Location: deployment/{deployment_result.container_name}/")
-        logger.info(f"  Artifacts: {len(deployment_result.artifacts)} files")
+        logger.opt(lazy=True).info("  Artifacts: {} files", lambda: len(deployment_result.artifacts))
         logger.info("="*70)
         logger.info("Agent Status:")
         logger.info("  1. ✓ Generated and validated")
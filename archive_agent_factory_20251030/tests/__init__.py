@@ -0,0 +1 @@
+"""Tests for the archived agent factory tools and validators"""
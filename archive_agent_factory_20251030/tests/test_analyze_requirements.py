@@ -0,0 +1,80 @@
+"""Tests for the analyze_requirements result cache"""
+
+import pytest
+
+from meta_agent.tools import analyze_requirements as requirements_module
+from meta_agent.tools.analyze_requirements import analyze_requirements
+
+
+ANALYSIS = {
+    "primary_goal": "Score loan applications",
+    "required_agents": ["DataAgent", "CalcAgent"],
+    "data_sources": ["postgres"],
+    "calculations_needed": [{"name": "dscr"}],
+    "modes_required": ["batch"],
+    "validation_rules": [],
+    "output_format": "json",
+    "constraints": [],
+    "complexity": "MEDIUM",
+    "estimated_agents": 2,
+    "llm_integration": False,
+    "features_required": [],
+}
+
+
+class FakeJsonClient:
+    """Stands in for LLMClient.generate_json, answering with canned responses"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.calls = []
+
+    def generate_json(self, **kwargs):
+        self.calls.append(kwargs)
+        return dict(self.responses.pop(0))
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(requirements_module, "_REQUIREMENTS_CACHE", {})
+
+
+def test_identical_request_is_answered_from_cache():
+    client = FakeJsonClient(ANALYSIS)
+
+    first = analyze_requirements("Build a DSCR scoring system", client)
+    second = analyze_requirements("Build a DSCR scoring system", client)
+
+    assert len(client.calls) == 1
+    assert second.model_dump() == first.model_dump()
+
+
+def test_cache_hits_are_independent_copies():
+    client = FakeJsonClient(ANALYSIS)
+
+    first = analyze_requirements("Build a DSCR scoring system", client)
+    first.required_agents.append("ReportAgent")
+    second = analyze_requirements("Build a DSCR scoring system", client)
+
+    assert second.required_agents == ["DataAgent", "CalcAgent"]
+
+
+def test_different_request_calls_the_llm():
+    client = FakeJsonClient(ANALYSIS, dict(ANALYSIS, primary_goal="Report on loans"))
+
+    analyze_requirements("Build a DSCR scoring system", client)
+    other = analyze_requirements("Build a loan report", client)
+
+    assert len(client.calls) == 2
+    assert other.primary_goal == "Report on loans"
+
+
+def test_failed_analysis_is_not_cached():
+    client = FakeJsonClient({"primary_goal": "incomplete"}, ANALYSIS)
+
+    with pytest.raises(RuntimeError):
+        analyze_requirements("Build a DSCR scoring system", client)
+    result = analyze_requirements("Build a DSCR scoring system", client)
+
+    assert len(client.calls) == 2
+    assert result.primary_goal == ANALYSIS["primary_goal"]
@@ -0,0 +1,99 @@
+"""Tests for code_validator security checks and result memoization"""
+
+import pytest
+
+from meta_agent import code_validator
+from meta_agent.code_validator import validate_code, validate_code_security
+
+
+UNSAFE_CODE = '''
+import os
+
+password = "admin123"
+
+
+def run(expression):
+    eval(expression)
+    exec(expression)
+    return os.system("ls")
+'''
+
+SAFE_CODE = '''
+import os
+
+
+def database_url():
+    return os.getenv("DATABASE_URL")
+'''
+
+
+def test_fail_fast_stops_at_first_error():
+    full = validate_code_security(UNSAFE_CODE)
+    fast = validate_code_security(UNSAFE_CODE, fail_fast=True)
+
+    assert not full.valid
+    assert full.error_count >= 3
+    assert not fast.valid
+    assert fast.error_count == 1
+
+
+def test_fail_fast_matches_full_report_for_safe_code():
+    full = validate_code_security(SAFE_CODE)
+    fast = validate_code_security(SAFE_CODE, fail_fast=True)
+
+    assert full.valid and fast.valid
+    assert fast.issues == full.issues
+
+
+def test_validate_code_fail_fast_gates_the_same_way():
+    assert not validate_code(UNSAFE_CODE, fail_fast=True).valid
+    assert validate_code(SAFE_CODE, fail_fast=True).valid
+
+
+@pytest.fixture
+def validations(monkeypatch):
+    """Start from empty caches and count uncached validations"""
+    monkeypatch.setattr(code_validator, "_VALIDATE_CACHE", {})
+    monkeypatch.setattr(code_validator, "_AST_CACHE", {})
+    calls = []
+    validate_code_impl = code_validator._validate_code_impl
+
+    def counting_validate_code_impl(code, fail_fast):
+        calls.append((code, fail_fast))
+        return validate_code_impl(code, fail_fast)
+
+    monkeypatch.setattr(code_validator, "_validate_code_impl", counting_validate_code_impl)
+    return calls
+
+
+def test_identical_code_is_validated_once(validations):
+    first = validate_code(SAFE_CODE)
+    # An equal string built separately must hit the same entry
+    second = validate_code("".join(list(SAFE_CODE)))
+
+    assert second is first
+    assert len(validations) == 1
+
+
+def test_memo_is_keyed_on_fail_fast(validations):
+    full = validate_code(UNSAFE_CODE)
+    fast = validate_code(UNSAFE_CODE, fail_fast=True)
+
+    assert len(validations) == 2
+    assert full.error_count > fast.error_count == 1
+    assert validate_code(UNSAFE_CODE) is full
+    assert validate_code(UNSAFE_CODE, fail_fast=True) is fast
+    assert len(validations) == 2
+
+
+def test_memo_evicts_oldest_entry(validations, monkeypatch):
+    monkeypatch.setattr(code_validator, "_VALIDATE_CACHE_MAX", 2)
+    codes = [f"value = {index}\n" for index in range(3)]
+    for code in codes:
+        validate_code(code)
+
+    assert len(code_validator._VALIDATE_CACHE) == 2
+    validate_code(codes[2])
+    assert len(validations) == 3
+    validate_code(codes[0])
+    assert len(validations) == 4
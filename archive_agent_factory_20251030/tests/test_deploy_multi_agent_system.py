@@ -0,0 +1,135 @@
+"""Tests for redeploy skipping and bundling in deploy_multi_agent_system"""
+
+import os
+import tarfile
+from pathlib import Path
+
+import pytest
+
+from meta_agent.tools import deploy_multi_agent_system as deploy_module
+from meta_agent.tools.deploy_multi_agent_system import (
+    MultiAgentSystemDeployer,
+    deploy_multi_agent_system,
+)
+
+
+@pytest.fixture
+def agents(tmp_path, monkeypatch):
+    """Two agents with code on disk; runs in tmp_path so .deploy_cache lands there"""
+    monkeypatch.chdir(tmp_path)
+    agents = {}
+    for name in ("Collector", "Reporter"):
+        code_path = tmp_path / "src" / f"{name.lower()}.py"
+        code_path.parent.mkdir(exist_ok=True)
+        code_path.write_text(f"class {name}:\n    pass\n")
+        agents[name] = {
+            "code_path": str(code_path),
+            "spec": {
+                "description": f"{name} agent",
+                "dependencies": {"python_packages": ["requests"]},
+            },
+        }
+    return agents
+
+
+@pytest.fixture
+def writes(monkeypatch):
+    """Record every artifact the deployer writes"""
+    written = []
+    write_artifact = MultiAgentSystemDeployer._write_artifact
+
+    def recording_write_artifact(path, *args, **kwargs):
+        written.append(Path(path).name)
+        return write_artifact(path, *args, **kwargs)
+
+    monkeypatch.setattr(
+        MultiAgentSystemDeployer, "_write_artifact", staticmethod(recording_write_artifact)
+    )
+    return written
+
+
+def test_unchanged_redeploy_is_skipped(tmp_path, agents, writes):
+    output_dir = tmp_path / "deployment"
+
+    first = deploy_multi_agent_system("test-system", agents, output_dir)
+    assert "orchestrator.py" in writes
+    writes.clear()
+
+    second = deploy_multi_agent_system("test-system", agents, output_dir)
+    assert writes == []
+    assert second == first
+
+
+def test_changed_agent_code_redeploys(tmp_path, agents, writes):
+    output_dir = tmp_path / "deployment"
+    deploy_multi_agent_system("test-system", agents, output_dir)
+    writes.clear()
+
+    code_path = agents["Collector"]["code_path"]
+    stat = os.stat(code_path)
+    os.utime(code_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    deploy_multi_agent_system("test-system", agents, output_dir)
+    assert "orchestrator.py" in writes
+
+
+def test_deleted_artifact_redeploys(tmp_path, agents, writes):
+    output_dir = tmp_path / "deployment"
+    deploy_multi_agent_system("test-system", agents, output_dir)
+    writes.clear()
+
+    (output_dir / "README.md").unlink()
+
+    deploy_multi_agent_system("test-system", agents, output_dir)
+    assert "README.md" in writes
+    assert (output_dir / "README.md").exists()
+
+
+def test_dedupe_change_redeploys_without_cache_links(tmp_path, agents, writes):
+    output_dir = tmp_path / "deployment"
+    deploy_multi_agent_system("test-system", agents, output_dir, dedupe=True)
+    assert (output_dir / "Dockerfile").stat().st_nlink > 1
+    writes.clear()
+
+    deploy_multi_agent_system("test-system", agents, output_dir, dedupe=False)
+    assert "Dockerfile" in writes
+    assert (output_dir / "Dockerfile").stat().st_nlink == 1
+
+
+def test_bundle_is_never_skipped(tmp_path, agents, monkeypatch):
+    output_dir = tmp_path / "deployment"
+    bundles = []
+    write_bundle = MultiAgentSystemDeployer._write_bundle
+
+    def recording_write_bundle(bundle_path, *args):
+        bundles.append(bundle_path)
+        return write_bundle(bundle_path, *args)
+
+    monkeypatch.setattr(
+        MultiAgentSystemDeployer, "_write_bundle", staticmethod(recording_write_bundle)
+    )
+
+    for _ in range(2):
+        result = deploy_multi_agent_system("test-system", agents, output_dir, bundle=True)
+        assert Path(result.artifacts[0]).exists()
+    assert len(bundles) == 2
+    assert not (output_dir / deploy_module._FINGERPRINT_FILE).exists()
+
+
+def test_bundle_reads_unchanged_agent_code_once(tmp_path, agents):
+    output_dir = tmp_path / "deployment"
+    deploy_module._read_agent_bytes.cache_clear()
+
+    deploy_multi_agent_system("test-system", agents, output_dir, bundle=True)
+    deploy_multi_agent_system("test-system", agents, output_dir, bundle=True)
+    info = deploy_module._read_agent_bytes.cache_info()
+    assert (info.misses, info.hits) == (2, 2)
+
+    code_path = Path(agents["Collector"]["code_path"])
+    code_path.write_text("class Collector:\n    edited = True\n")
+    result = deploy_multi_agent_system("test-system", agents, output_dir, bundle=True)
+
+    assert deploy_module._read_agent_bytes.cache_info().misses == 3
+    with tarfile.open(result.artifacts[0]) as tar:
+        bundled = tar.extractfile("deployment/agents/collector.py").read()
+    assert bundled == code_path.read_bytes()
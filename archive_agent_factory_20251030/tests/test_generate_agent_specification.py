@@ -0,0 +1,239 @@
+"""Tests for streamed YAML checking and batched requests in generate_agent_specification"""
+
+import pytest
+import yaml
+
+from meta_agent.tools import generate_agent_specification as spec_module
+from meta_agent.tools.analyze_requirements import RequirementsAnalysis
+from meta_agent.tools.design_agent_architecture import AgentDesign, ArchitectureDesign
+
+
+VALID_SPEC = '''```yaml
+agent_name: "Collector"
+description: >
+  Collects loan data from the database
+  and hands it to the scoring agent.
+version: '1.0'
+inputs:
+  - name: loan_id
+    type: string
+    required: true
+  - {name: as_of, type: date, required: false}
+outputs: [score, reasons]
+tools:
+  - name: fetch_loans
+    description: |
+      SELECT * FROM loans
+      WHERE status = 'open': returns rows
+    parameters:
+      limit: 100
+      order: "created_at: desc"
+dependencies:
+  python_packages:
+    - requests
+    - sqlalchemy>=2.0.0
+  other_agents: []
+error_handling:
+  retries: 3
+  on_failure: "log: and continue"
+mapping: {
+  a: 1,
+  b: 2
+}
+```
+'''
+
+# Line 2 maps a key inside a plain scalar, which no later text can repair
+INVALID_SPEC = "agent_name: Collector\ndescription: ErrorType: bad value\n" + "".join(
+    f"field_{index}: value {index}\n" for index in range(200)
+)
+
+
+class FakeStreamClient:
+    """Stands in for LLMClient.generate_stream, yielding text in small chunks"""
+
+    def __init__(self, text, chunk_size=7):
+        self.text = text
+        self.chunk_size = chunk_size
+        self.chunks_sent = 0
+        self.closed = False
+
+    def generate_stream(self, **kwargs):
+        try:
+            for start in range(0, len(self.text), self.chunk_size):
+                self.chunks_sent += 1
+                yield self.text[start:start + self.chunk_size]
+        finally:
+            self.closed = True
+
+
+def test_valid_spec_cut_at_every_line_is_not_rejected(monkeypatch):
+    monkeypatch.setattr(spec_module, "_STREAM_CHECK_LINES", 1)
+    lines = VALID_SPEC.splitlines(keepends=True)
+    for cut in range(1, len(lines) + 1):
+        # Also end half way through the following line, as a live stream would
+        partial = "".join(lines[:cut]) + "".join(lines[cut:cut + 1])[:5]
+        client = FakeStreamClient(partial)
+        assert spec_module._stream_yaml(client, "prompt") == partial
+        assert client.closed
+
+
+def test_early_syntax_error_stops_the_stream():
+    client = FakeStreamClient(INVALID_SPEC)
+    with pytest.raises(yaml.YAMLError):
+        spec_module._stream_yaml(client, "prompt")
+    assert client.closed
+    assert client.chunks_sent < len(INVALID_SPEC) / client.chunk_size / 2
+
+
+AGENT_NAMES = ["Alpha", "Bravo", "Charlie", "Delta", "Echo"]
+
+
+@pytest.fixture
+def architecture():
+    return ArchitectureDesign(
+        agents=[
+            AgentDesign(
+                agent_name=name,
+                agent_type="analysis",
+                role="supporting_agent",
+                responsibilities=[f"Handle {name.lower()} work"],
+                dependencies=[],
+                complexity="LOW",
+            )
+            for name in AGENT_NAMES
+        ],
+        interactions=[],
+        data_flow="Alpha to Echo",
+        no_orchestrator_needed=True,
+        reasoning="test",
+    )
+
+
+@pytest.fixture
+def requirements():
+    return RequirementsAnalysis(
+        primary_goal="Score loans",
+        required_agents=AGENT_NAMES,
+        data_sources=["postgres"],
+        calculations_needed=[],
+        modes_required=["batch"],
+        validation_rules=[],
+        output_format="json",
+        constraints=[],
+        complexity="LOW",
+        estimated_agents=len(AGENT_NAMES),
+        llm_integration=False,
+        features_required=[],
+    )
+
+
+def spec_document(name):
+    return yaml.safe_dump({
+        "agent_name": name,
+        "agent_type": "analysis",
+        "version": "1.0",
+        "description": f"{name} agent",
+        "role": "supporting_agent",
+    })
+
+
+class FakeBatchClient:
+    """Stands in for LLMClient.generate, answering each batch with canned documents"""
+
+    def __init__(self, context_length, documents):
+        self.context_length = context_length
+        self.documents = documents
+        self.calls = []
+
+    def generate(self, **kwargs):
+        self.calls.append(kwargs)
+        names = [name for name in AGENT_NAMES if f"AGENT NAME: {name}" in kwargs["user_prompt"]]
+        return "```yaml\n" + "---\n".join(self.documents(name) for name in names) + "```"
+
+
+@pytest.mark.parametrize("context_length", [8192, 16384, 32768, 131072])
+def test_batches_fit_the_context_window(architecture, requirements, context_length):
+    groups = spec_module._plan_batches(architecture, requirements, context_length)
+
+    assert [a.agent_name for group in groups for a in group] == AGENT_NAMES
+    for group in groups:
+        if len(group) > 1:
+            prompt = spec_module._batch_user_prompt(group, architecture, requirements)
+            assert (
+                spec_module._estimate_prompt_tokens(prompt)
+                + spec_module._SPEC_MAX_TOKENS * len(group)
+                <= context_length
+            )
+    if context_length <= 8192:
+        assert all(len(group) == 1 for group in groups)
+    if context_length >= 131072:
+        assert len(groups) == 1
+
+
+def test_batch_output_budget_fits_the_context_window(architecture, requirements):
+    client = FakeBatchClient(12000, spec_document)
+    agents = architecture.agents[:3]
+
+    batched = spec_module._generate_batch(agents, architecture, requirements, client)
+
+    assert list(batched) == ["Alpha", "Bravo", "Charlie"]
+    prompt_tokens = spec_module._estimate_prompt_tokens(client.calls[0]["user_prompt"])
+    assert client.calls[0]["max_tokens"] == 12000 - prompt_tokens
+
+
+def test_batch_discards_invalid_and_unrequested_documents(architecture, requirements):
+    def documents(name):
+        if name == "Bravo":
+            return "agent_name: Bravo\ndescription: [unclosed\n"
+        if name == "Charlie":
+            return "agent_name: Charlie\nversion: '1.0'\n"
+        return spec_document(name) + "---\n" + spec_document("Unrequested")
+
+    client = FakeBatchClient(131072, documents)
+    batched = spec_module._generate_batch(architecture.agents[:4], architecture, requirements, client)
+
+    assert sorted(batched) == ["Alpha", "Delta"]
+    yaml_spec, spec_dict = batched["Alpha"]
+    assert spec_dict == yaml.safe_load(yaml_spec)
+
+
+@pytest.fixture
+def fallbacks(monkeypatch):
+    """Replace per-agent generation, recording which agents fell back to it"""
+    fallbacks = []
+
+    def fake_retry(agent_design, architecture, requirements, llm_client, max_retries):
+        fallbacks.append(agent_design.agent_name)
+        text = spec_document(agent_design.agent_name)
+        return text, yaml.safe_load(text)
+
+    monkeypatch.setattr(spec_module, "generate_agent_specification_with_retry", fake_retry)
+    return fallbacks
+
+
+def test_failed_batch_documents_fall_back_per_agent(architecture, requirements, fallbacks):
+    client = FakeBatchClient(
+        16384, lambda name: "not: [valid\n" if name in ("Bravo", "Echo") else spec_document(name)
+    )
+
+    specs = spec_module.generate_all_specifications(architecture, requirements, client)
+
+    assert list(specs) == AGENT_NAMES
+    assert sorted(fallbacks) == ["Bravo", "Echo"]
+    assert len(client.calls) == len([
+        group for group in spec_module._plan_batches(architecture, requirements, 16384)
+        if len(group) > 1
+    ])
+    for name, (yaml_spec, spec_dict) in specs.items():
+        assert spec_dict["agent_name"] == name
+
+
+def test_small_context_window_generates_per_agent(architecture, requirements, fallbacks):
+    client = FakeBatchClient(8192, spec_document)
+
+    specs = spec_module.generate_all_specifications(architecture, requirements, client)
+
+    assert list(specs) == AGENT_NAMES
+    assert client.calls == []
+    assert sorted(fallbacks) == AGENT_NAMES
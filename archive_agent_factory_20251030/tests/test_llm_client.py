@@ -0,0 +1,139 @@
+"""Tests for LLMClient streaming and bounded concurrent LLM calls"""
+
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
+
+import pytest
+from langchain_openai import ChatOpenAI
+
+from config import settings
+from meta_agent.utils.llm_client import LLMClient, map_llm_calls
+
+
+CHUNK_COUNT = 100
+
+
+class StreamingHandler(BaseHTTPRequestHandler):
+    """Answers every chat completion with CHUNK_COUNT slow SSE chunks"""
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.end_headers()
+        sent = 0
+        try:
+            for index in range(CHUNK_COUNT):
+                chunk = {
+                    "id": "chatcmpl-test",
+                    "object": "chat.completion.chunk",
+                    "created": 0,
+                    "model": "test-model",
+                    "choices": [{"index": 0, "delta": {"content": f"line {index}\n"}, "finish_reason": None}],
+                }
+                self.wfile.write(f"data: {json.dumps(chunk)}\n\n".encode("utf-8"))
+                self.wfile.flush()
+                sent += 1
+                time.sleep(0.01)
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+        finally:
+            self.server.chunks_sent = sent
+            self.server.finished.set()
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StreamingHandler)
+    server.finished = threading.Event()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(server, monkeypatch):
+    """LLMClient pointed at the local server, skipping the LM Studio checks"""
+    monkeypatch.setattr(LLMClient, "_initialize", lambda self: None)
+    client = LLMClient()
+    client.llm = ChatOpenAI(
+        base_url=f"http://127.0.0.1:{server.server_port}/v1",
+        api_key="test",
+        model="test-model",
+        max_retries=0
+    )
+    client.available = True
+    return client
+
+
+def test_closing_the_stream_drops_the_connection(server, client):
+    stream = client.generate_stream("system", "user")
+    assert next(stream) == "line 0\n"
+    stream.close()
+
+    assert server.finished.wait(10)
+    assert server.chunks_sent < CHUNK_COUNT / 2
+
+
+def test_exhausted_stream_yields_every_chunk(server, client):
+    text = "".join(client.generate_stream("system", "user"))
+
+    assert text == "".join(f"line {index}\n" for index in range(CHUNK_COUNT))
+
+
+def test_map_llm_calls_keeps_order_and_can_return_exceptions():
+    def check(value):
+        if value == 2:
+            raise ValueError("two")
+        return value * 10
+
+    results = map_llm_calls(check, range(4), return_exceptions=True)
+
+    assert [results[0], results[1], results[3]] == [0, 10, 30]
+    assert isinstance(results[2], ValueError)
+    with pytest.raises(ValueError):
+        map_llm_calls(check, range(4))
+
+
+def test_nested_calls_never_exceed_the_client_limit(monkeypatch):
+    """Outer and inner maps share the client's slots, as Steps 5 and multi-file code do"""
+    monkeypatch.setattr(settings, "llm_max_concurrent_calls", 3)
+    monkeypatch.setattr(LLMClient, "_initialize", lambda self: None)
+    client = LLMClient()
+    client.available = True
+    lock = threading.Lock()
+    in_flight = []
+    peak = []
+
+    class SlowLLM:
+        def generate(self, messages, **params):
+            with lock:
+                in_flight.append(1)
+                peak.append(len(in_flight))
+            time.sleep(0.01)
+            with lock:
+                in_flight.pop()
+            return SimpleNamespace(
+                generations=[[SimpleNamespace(message=SimpleNamespace(content="ok"))]],
+                llm_output={}
+            )
+
+    client.llm = SlowLLM()
+
+    def generate_agent(agent):
+        return map_llm_calls(lambda component: client.generate("system", f"component {component}"), range(4))
+
+    results = map_llm_calls(generate_agent, range(4))
+
+    assert results == [["ok"] * 4] * 4
+    assert max(peak) == 3
@@ -4,6 +4,8 @@ Extracts structured requirements from natural language using LLM.
 NO FALLBACKS - Strictly requires LLM.
 """
 
+import hashlib
+import json
 from typing import Dict, List, Any
 from pydantic import BaseModel, Field
 from loguru import logger
@@ -27,24 +29,8 @@ class RequirementsAnalysis(BaseModel):
     features_required: List[str] = Field(..., description="Special features needed")
 
 
-def analyze_requirements(user_request: str, llm_client: LLMClient) -> RequirementsAnalysis:
-    """
-    Analyze natural language requirements and extract structured information.
-    
-    Args:
-        user_request: Natural language description of what user wants
-        llm_client: LLM client instance
-    
-    Returns:
-        Structured requirements analysis
-    
-    Raises:
-        RuntimeError: If LLM is not available
-        ValueError: If LLM response is invalid
-    """
-    logger.info(f"Analyzing requirements from user request (length: {len(user_request)} chars)")
-    
-    system_prompt = """You are an expert system architect specializing in agent-based systems.
+# Prompts are constant, so they are built once at import time
+SYSTEM_PROMPT = """You are an expert system architect specializing in agent-based systems.
 Your task is to analyze user requirements and extract structured information.
 
 Given a natural language description of what the user wants to build, you must:
@@ -80,19 +66,54 @@ Output MUST be valid JSON with this exact structure:
 
 IMPORTANT: Output ONLY the JSON, no other text."""
 
-    user_prompt = f"""Analyze this user requirement and extract structured information:
+USER_PROMPT_TEMPLATE = """Analyze this user requirement and extract structured information:
 
 USER REQUEST:
 {user_request}
 
 Provide the analysis in the JSON format specified."""
 
+
+# Analyses already produced in this process, keyed by a digest of the request.
+# Stored as JSON so every hit rebuilds independent lists and dicts.
+_REQUIREMENTS_CACHE: Dict[str, str] = {}
+
+
+def analyze_requirements(user_request: str, llm_client: LLMClient) -> RequirementsAnalysis:
+    """
+    Analyze natural language requirements and extract structured information.
+    
+    Identical requests are answered from an in-process cache without calling
+    the LLM again.
+    
+    Args:
+        user_request: Natural language description of what user wants
+        llm_client: LLM client instance
+    
+    Returns:
+        Structured requirements analysis
+    
+    Raises:
+        RuntimeError: If LLM is not available
+        ValueError: If LLM response is invalid
+    """
+    logger.info(f"Analyzing requirements from user request (length: {len(user_request)} chars)")
+    
+    cache_key = hashlib.blake2b(user_request.encode('utf-8'), digest_size=16).hexdigest()
+    cached = _REQUIREMENTS_CACHE.get(cache_key)
+    if cached is not None:
+        logger.info("✓ Requirements loaded from cache")
+        # Already validated when it was stored, so skip field validation
+        return RequirementsAnalysis.model_construct(**json.loads(cached))
+    
+    user_prompt = USER_PROMPT_TEMPLATE.format(user_request=user_request)
+
     try:
         # Call LLM to analyze requirements
         response_json = llm_client.generate_json(
-            system_prompt=system_prompt,
+            system_prompt=SYSTEM_PROMPT,
             user_prompt=user_prompt,
-            temperature=0.1  # Low temperature for consistency
+            temperature=0.0  # Greedy decoding: identical prompts give identical analyses
         )
         
         # Parse into Pydantic model for validation
@@ -104,6 +125,7 @@ Provide the analysis in the JSON format specified."""
         logger.info(f"  Complexity: {requirements.complexity}")
         logger.info(f"  LLM integration: {requirements.llm_integration}")
         
+        _REQUIREMENTS_CACHE[cache_key] = requirements.model_dump_json()
         return requirements
         
     except Exception as e:
@@ -129,28 +151,36 @@ def validate_requirements(requirements: RequirementsAnalysis) -> bool:
     """
     logger.info("Validating requirements...")
     
-    # Check required fields are not empty
+    # Cheap scalar checks first so common failures return early
     if not requirements.primary_goal:
         raise ValueError("Primary goal must be specified")
     
-    if not requirements.required_agents:
-        raise ValueError("At least one agent must be required")
-    
     if requirements.estimated_agents < 1:
         raise ValueError("Estimated agents must be at least 1")
     
-    if requirements.complexity not in ["LOW", "MEDIUM", "HIGH"]:
+    if requirements.complexity not in ("LOW", "MEDIUM", "HIGH"):
         raise ValueError(f"Invalid complexity: {requirements.complexity}")
     
+    if not requirements.required_agents:
+        raise ValueError("At least one agent must be required")
+    
+    # Single scan to see which kinds of agents are required
+    needs_data = needs_calc = False
+    for agent in requirements.required_agents:
+        if "Data" in agent:
+            needs_data = True
+        if "Calc" in agent:
+            needs_calc = True
+        if needs_data and needs_calc:
+            break
+    
     # Check for data sources if agents require data
-    if any("Data" in agent for agent in requirements.required_agents):
-        if not requirements.data_sources:
-            raise ValueError("Data sources must be specified if DataAgent is required")
+    if needs_data and not requirements.data_sources:
+        raise ValueError("Data sources must be specified if DataAgent is required")
     
     # Check for calculation details if calculation agents present
-    if any("Calc" in agent for agent in requirements.required_agents):
-        if not requirements.calculations_needed:
-            raise ValueError("Calculations must be specified if CalcAgent is required")
+    if needs_calc and not requirements.calculations_needed:
+        raise ValueError("Calculations must be specified if CalcAgent is required")
     
     logger.info("✓ Requirements validation passed")
     return True
@@ -41,29 +41,12 @@ class ArchitectureDesign(BaseModel):
     reasoning: str = Field(..., description="Reasoning for architecture decisions")
 
 
-def design_agent_architecture(
-    requirements: RequirementsAnalysis,
-    llm_client: LLMClient
-) -> ArchitectureDesign:
-    """
-    Design agent system architecture from requirements.
-    
-    Args:
-        requirements: Analyzed requirements
-        llm_client: LLM client instance
-    
-    Returns:
-        Architecture design
-    
-    Raises:
-        RuntimeError: If LLM is not available
-        ValueError: If LLM response is invalid
-    """
-    logger.info("Designing agent architecture...")
-    logger.info(f"  Complexity: {requirements.complexity}")
-    logger.info(f"  Estimated agents: {requirements.estimated_agents}")
-    
-    system_prompt = """You are an expert software architect specializing in agent-based systems.
+_COMPLEXITY_LEVELS = frozenset({"LOW", "MEDIUM", "HIGH"})
+
+
+# Kept byte-identical across calls so the LLM server can reuse its cached
+# prefix; only the user prompt varies per request
+_ARCHITECT_SYSTEM_PROMPT = """You are an expert software architect specializing in agent-based systems.
 Your task is to design a practical, efficient agent architecture based on requirements.
 
 Given requirements, you must design:
@@ -121,36 +104,85 @@ Output MUST be valid JSON with this exact structure:
 
 IMPORTANT: Output ONLY the JSON, no other text."""
 
-    user_prompt = f"""Design an agent architecture for these requirements:
+_ARCHITECT_USER_PROMPT = """Design an agent architecture for these requirements:
 
-PRIMARY GOAL: {requirements.primary_goal}
-REQUIRED AGENTS: {', '.join(requirements.required_agents)}
-DATA SOURCES: {', '.join(requirements.data_sources)}
-CALCULATIONS: {len(requirements.calculations_needed)} calculations
-MODES: {', '.join(requirements.modes_required)}
-COMPLEXITY: {requirements.complexity}
-LLM INTEGRATION: {requirements.llm_integration}
-FEATURES: {', '.join(requirements.features_required)}
+PRIMARY GOAL: {primary_goal}
+REQUIRED AGENTS: {required_agents}
+DATA SOURCES: {data_sources}
+CALCULATIONS: {calculation_count} calculations
+MODES: {modes}
+COMPLEXITY: {complexity}
+LLM INTEGRATION: {llm_integration}
+FEATURES: {features}
 
 Design an efficient, practical architecture in the JSON format specified."""
 
+
+def design_agent_architecture(
+    requirements: RequirementsAnalysis,
+    llm_client: LLMClient
+) -> ArchitectureDesign:
+    """
+    Design agent system architecture from requirements.
+    
+    Args:
+        requirements: Analyzed requirements
+        llm_client: LLM client instance
+    
+    Returns:
+        Architecture design
+    
+    Raises:
+        RuntimeError: If LLM is not available
+        ValueError: If LLM response is invalid
+    """
+    logger.bind(
+        complexity=requirements.complexity,
+        estimated_agents=requirements.estimated_agents
+    ).info(
+        f"Designing agent architecture... (complexity: {requirements.complexity}, "
+        f"estimated agents: {requirements.estimated_agents})"
+    )
+    
+    user_prompt = _ARCHITECT_USER_PROMPT.format(
+        primary_goal=requirements.primary_goal,
+        required_agents=", ".join(requirements.required_agents),
+        data_sources=", ".join(requirements.data_sources),
+        calculation_count=len(requirements.calculations_needed),
+        modes=", ".join(requirements.modes_required),
+        complexity=requirements.complexity,
+        llm_integration=requirements.llm_integration,
+        features=", ".join(requirements.features_required)
+    )
+
     try:
         # Call LLM to design architecture
         response_json = llm_client.generate_json(
-            system_prompt=system_prompt,
+            system_prompt=_ARCHITECT_SYSTEM_PROMPT,
             user_prompt=user_prompt,
             temperature=0.1
         )
         
-        # Parse into Pydantic model for validation
-        architecture = ArchitectureDesign(**response_json)
+        # Validate straight from the parsed dict; pydantic-core compiled the
+        # ArchitectureDesign validator once when the class was defined
+        architecture = ArchitectureDesign.model_validate(response_json)
         
-        logger.info(f"✓ Architecture designed successfully")
-        logger.info(f"  Agents: {len(architecture.agents)}")
-        for agent in architecture.agents:
-            logger.info(f"    - {agent.agent_name} ({agent.agent_type}, {agent.role}, {agent.complexity})")
-        logger.info(f"  Interactions: {len(architecture.interactions)}")
-        logger.info(f"  Orchestrator needed: {not architecture.no_orchestrator_needed}")
+        # One record; the bound fields carry the same data for structured sinks
+        agent_lines = [
+            f"{agent.agent_name} ({agent.agent_type}, {agent.role}, {agent.complexity})"
+            for agent in architecture.agents
+        ]
+        logger.bind(
+            agents=agent_lines,
+            interactions=len(architecture.interactions),
+            orchestrator_needed=not architecture.no_orchestrator_needed
+        ).info("\n".join([
+            f"✓ Architecture designed successfully",
+            f"  Agents: {len(agent_lines)}",
+            *(f"    - {line}" for line in agent_lines),
+            f"  Interactions: {len(architecture.interactions)}",
+            f"  Orchestrator needed: {not architecture.no_orchestrator_needed}"
+        ]))
         
         return architecture
         
@@ -180,10 +212,12 @@ def validate_architecture(architecture: ArchitectureDesign) -> bool:
     if not architecture.agents:
         raise ValueError("At least one agent must be designed")
     
-    # Check all agent names are unique
-    agent_names = [a.agent_name for a in architecture.agents]
-    if len(agent_names) != len(set(agent_names)):
-        raise ValueError("Agent names must be unique")
+    # Check all agent names are unique, stopping at the first duplicate
+    agent_names = set()
+    for agent in architecture.agents:
+        if agent.agent_name in agent_names:
+            raise ValueError(f"Agent names must be unique (duplicate: {agent.agent_name})")
+        agent_names.add(agent.agent_name)
     
     # Check interactions reference valid agents
     for interaction in architecture.interactions:
@@ -192,18 +226,17 @@ def validate_architecture(architecture: ArchitectureDesign) -> bool:
         if interaction.to_agent not in agent_names:
             raise ValueError(f"Interaction references unknown agent: {interaction.to_agent}")
     
-    # Check dependencies reference valid components
+    # Check dependencies and complexity values in one pass
     for agent in architecture.agents:
         for dep in agent.dependencies:
             # Dependencies can be agents or external services
             if dep in agent_names:
                 continue
             # External dependencies are OK (PostgreSQL, LLMClient, etc.)
-            logger.debug(f"{agent.agent_name} depends on external: {dep}")
-    
-    # Check complexity values are valid
-    for agent in architecture.agents:
-        if agent.complexity not in ["LOW", "MEDIUM", "HIGH"]:
+            # Arguments are only formatted if a DEBUG sink is listening
+            logger.debug("{} depends on external: {}", agent.agent_name, dep)
+        
+        if agent.complexity not in _COMPLEXITY_LEVELS:
             raise ValueError(f"Invalid complexity for {agent.agent_name}: {agent.complexity}")
     
     logger.info("✓ Architecture validation passed")
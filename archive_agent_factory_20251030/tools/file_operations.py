@@ -4,13 +4,29 @@ Utilities for writing and reading files.
 NO FALLBACKS - Strict file operations with proper error handling.
 """
 
+import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Union
 from loguru import logger
 
 from config import settings
 
 
+# Relative paths resolve against the directory the process started in. It is
+# read once here; the tools never change directory.
+_CWD = Path.cwd()
+
+
+@lru_cache(maxsize=256)
+def _resolve(path: Union[str, Path]) -> Path:
+    """Make path absolute, relative to the startup working directory"""
+    file_path = Path(path)
+    return file_path if file_path.is_absolute() else _CWD / file_path
+
+
 def write_file(path: str, content: str, overwrite: bool = False) -> Dict[str, Any]:
     """
     Write content to a file.
@@ -28,11 +44,8 @@ def write_file(path: str, content: str, overwrite: bool = False) -> Dict[str, An
         PermissionError: If no permission to write
         OSError: If other I/O error occurs
     """
-    file_path = Path(path)
-    
     # Make path absolute if relative
-    if not file_path.is_absolute():
-        file_path = Path.cwd() / file_path
+    file_path = _resolve(path)
     
     logger.info(f"Writing file: {file_path}")
     
@@ -46,20 +59,34 @@ def write_file(path: str, content: str, overwrite: bool = False) -> Dict[str, An
     # Create parent directories if needed
     file_path.parent.mkdir(parents=True, exist_ok=True)
     
+    bytes_written = _write_content(file_path, content)
+    
+    logger.info(f"✓ File written: {file_path}")
+    logger.info(f"  Size: {bytes_written} bytes")
+    
+    return {
+        "success": True,
+        "path": str(file_path),
+        "bytes_written": bytes_written
+    }
+
+
+def _write_content(file_path: Path, content: str) -> int:
+    """
+    Write content to an absolute path whose parent already exists.
+    
+    Returns:
+        Number of bytes written
+    
+    Raises:
+        PermissionError: If no permission to write
+        OSError: If other I/O error occurs
+    """
     try:
-        # Write content
-        file_path.write_text(content, encoding='utf-8')
-        
-        bytes_written = len(content.encode('utf-8'))
-        
-        logger.info(f"✓ File written: {file_path}")
-        logger.info(f"  Size: {bytes_written} bytes")
-        
-        return {
-            "success": True,
-            "path": str(file_path),
-            "bytes_written": bytes_written
-        }
+        # Encode once: the same buffer is written and measured
+        data = content.encode('utf-8')
+        file_path.write_bytes(data)
+        return len(data)
         
     except PermissionError as e:
         logger.error(f"Permission denied: {file_path}")
@@ -89,23 +116,24 @@ def read_file(path: str) -> Dict[str, Any]:
         PermissionError: If no permission to read
         OSError: If other I/O error occurs
     """
-    file_path = Path(path)
-    
     # Make path absolute if relative
-    if not file_path.is_absolute():
-        file_path = Path.cwd() / file_path
+    file_path = _resolve(path)
     
     logger.info(f"Reading file: {file_path}")
     
-    if not file_path.exists():
-        raise FileNotFoundError(f"File not found: {file_path}")
+    # One stat answers exists, is-file and size together
+    try:
+        file_stat = os.stat(file_path)
+    except FileNotFoundError as e:
+        raise FileNotFoundError(f"File not found: {file_path}") from e
     
-    if not file_path.is_file():
+    if not stat.S_ISREG(file_stat.st_mode):
         raise OSError(f"Not a file: {file_path}")
     
     try:
-        content = file_path.read_text(encoding='utf-8')
-        size = file_path.stat().st_size
+        with open(file_path, 'rb') as f:
+            content = f.read().decode('utf-8')
+        size = file_stat.st_size
         
         logger.info(f"✓ File read: {file_path}")
         logger.info(f"  Size: {size} bytes")
@@ -144,11 +172,8 @@ def create_directory(path: str) -> Dict[str, Any]:
         PermissionError: If no permission to create directory
         OSError: If other error occurs
     """
-    dir_path = Path(path)
-    
     # Make path absolute if relative
-    if not dir_path.is_absolute():
-        dir_path = Path.cwd() / dir_path
+    dir_path = _resolve(path)
     
     logger.info(f"Creating directory: {dir_path}")
     
@@ -198,27 +223,28 @@ def write_agent_files(
     """
     logger.info(f"Writing files for agent: {agent_name}")
     
-    written_files = {}
-    
-    # Write specification
-    spec_path = settings.spec_dir / f"{agent_name.lower()}.yaml"
-    write_file(str(spec_path), specification, overwrite=True)
-    written_files["specification"] = str(spec_path)
-    
-    # Write code
-    code_path = settings.output_dir / "agents" / f"{agent_name.lower()}.py"
-    write_file(str(code_path), code, overwrite=True)
-    written_files["code"] = str(code_path)
+    name = agent_name.lower()
+    targets = {
+        "specification": (settings.spec_dir / f"{name}.yaml", specification),
+        "code": (settings.output_dir / "agents" / f"{name}.py", code)
+    }
     
     # Write tests if provided
     if tests:
-        test_path = settings.output_dir / "tests" / f"test_{agent_name.lower()}.py"
-        write_file(str(test_path), tests, overwrite=True)
-        written_files["tests"] = str(test_path)
+        targets["tests"] = (settings.output_dir / "tests" / f"test_{name}.py", tests)
     
-    logger.info(f"✓ All files written for {agent_name}")
-    for file_type, path in written_files.items():
-        logger.info(f"  {file_type}: {path}")
+    # Resolve every target once and create each parent directory once. Agent
+    # files are always overwritten, so there is no existence check.
+    prepared = [(_resolve(path), content) for path, content in targets.values()]
+    for parent in {file_path.parent for file_path, _ in prepared}:
+        parent.mkdir(parents=True, exist_ok=True)
+    
+    # The files are independent, so write them concurrently
+    with ThreadPoolExecutor(max_workers=len(prepared)) as executor:
+        list(executor.map(lambda item: _write_content(*item), prepared))
+    
+    written_files = {file_type: str(path) for file_type, (path, _) in targets.items()}
+    
+    logger.info(f"✓ All files written for {agent_name}: {written_files}")
     
     return written_files
-
@@ -5,31 +5,162 @@ NO FALLBACKS - Strictly requires LLM.
 Includes auto-retry mechanism for syntax errors.
 """
 
-from typing import Dict, Any, Optional
+import re
+import threading
+from functools import lru_cache
+from hashlib import blake2b
+from typing import Dict, Any, List, Optional, Tuple
 from loguru import logger
 import yaml
-import ast
 
-from meta_agent.utils.llm_client import LLMClient
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
 
+from meta_agent.utils.llm_client import LLMClient, map_llm_calls
 
-def _check_syntax(code: str) -> Optional[str]:
+
+# Module-level so every call sends the same system prompt prefix; per-agent
+# details go in the user prompt only
+_CODEGEN_SYSTEM_PROMPT = """You are an expert Python developer specializing in agent systems.
+Your task is to generate production-ready Python code from a YAML specification.
+
+REQUIREMENTS:
+1. Generate complete, working Python code
+2. Follow PEP 8 style guide strictly
+3. Use type hints throughout (from typing import ...)
+4. Include comprehensive docstrings (Google style)
+5. Use Pydantic for data validation
+6. Use loguru for logging
+7. Include error handling (try/except with specific exceptions)
+8. NO hardcoded values - all config from environment or parameters
+9. Make it compatible with the agent system (proper imports, structure)
+10. Include __init__ method with proper initialization
+11. All methods should have clear purpose and clean implementation
+12. ENSURE ALL CODE IS SYNTACTICALLY VALID - no incomplete functions or classes
+13. EVERY function and class MUST have a complete body
+14. ALL brackets, parentheses, and quotes MUST be properly closed
+
+SECURITY - CRITICAL RULES:
+- NEVER hardcode passwords, API keys, tokens, or secrets
+- ALWAYS use os.getenv() for sensitive configuration (e.g., os.getenv('DATABASE_URL'))
+- Database credentials must come from environment variables
+- Use empty strings "" for default password values, NOT example values like "admin" or "password123"
+- Example: password = os.getenv('DB_PASSWORD', '') ✓
+- Example: password = "admin" ✗ WRONG
+
+CODE STRUCTURE:
+- Imports at top (standard library, then third-party, then local)
+- Pydantic models for data structures (if needed)
+- Main agent class
+- All methods with docstrings
+- Proper error handling in each method
+- Logger statements for key operations
+
+CRITICAL - CODE COMPLETENESS:
+- The generated code MUST parse without syntax errors
+- DO NOT truncate output - generate the ENTIRE implementation
+- Every function definition needs a body (cannot end with just a colon)
+- Every class definition needs a body
+- All strings must be properly quoted
+- All parentheses, brackets, and braces must be balanced
+
+IMPORTANT:
+- Output ONLY Python code, no explanations
+- Code must be syntactically correct and complete
+- No placeholder or TODO comments
+- Complete, working implementation based on spec
+- All sensitive values from environment variables
+"""
+
+
+# Output budget per spec complexity; decode time grows with the cap, and small
+# tools need far less than a multi-component agent
+_MAX_TOKENS_BY_COMPLEXITY = {"LOW": 1024, "MEDIUM": 2048, "HIGH": 4096}
+_MAX_TOKENS_CEILING = 4096
+
+
+# Opening markdown fence around LLM output. Only the start of the response is
+# matched; the closing fence is checked with endswith so the body is never scanned
+_OPENING_FENCE_RE = re.compile(r"```(?:python)?")
+
+
+# Substrings that mark docstrings, type hints and error handling in generated code
+_METADATA_MARKERS = {
+    '"""': "docstring",
+    "'''": "docstring",
+    "->": "type_hint",
+    ": ": "type_hint",
+    "try": "try",
+    "except": "except",
+}
+# 'try' only counts before a colon, checked by lookahead so that a following
+# ': ' is still seen as a type-hint marker
+_METADATA_RE = re.compile('"""' + r"|'''|->|: |try(?=:)|except")
+
+
+@lru_cache(maxsize=64)
+def _parse_spec(yaml_specification: str) -> Any:
+    """
+    Parse a YAML specification with the libyaml loader when available.
+    
+    Cached because multi-file generation parses the same spec for the main
+    file and again per call; callers must treat the result as read-only.
+    """
+    return yaml.load(yaml_specification, Loader=SafeLoader)
+
+
+# Syntax-check outcomes keyed by code digest; the LLM often returns the same
+# broken candidate again on retry
+_SYNTAX_CACHE: Dict[bytes, Optional[Tuple[str, int]]] = {}
+_SYNTAX_CACHE_MAX = 256
+# Step 5 generates agents in worker threads, so eviction and insertion are locked
+_SYNTAX_CACHE_LOCK = threading.Lock()
+_NOT_CACHED = object()
+
+
+def _check_syntax(code: str) -> Optional[Tuple[str, int]]:
     """
-    Check code syntax and return error message if invalid.
+    Check code syntax and return error details if invalid.
     
     Args:
         code: Python code to check
     
     Returns:
-        Error message if syntax is invalid, None otherwise
+        (error message, line number or 0) if syntax is invalid, None otherwise
     """
+    key = blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+    cached = _SYNTAX_CACHE.get(key, _NOT_CACHED)
+    if cached is not _NOT_CACHED:
+        return cached
+    
     try:
-        ast.parse(code)
-        return None
+        # Compile to a throwaway code object: the parse happens in C without
+        # materialising Python AST nodes, and compile-time errors such as
+        # 'return' outside a function are caught as well
+        compile(code, '<generated>', 'exec', dont_inherit=True)
+        error = None
     except SyntaxError as e:
-        return f"Syntax error at line {e.lineno}: {e.msg}"
+        error = (f"Syntax error at line {e.lineno}: {e.msg}", e.lineno or 0)
     except Exception as e:
-        return f"Parse error: {str(e)}"
+        error = (f"Parse error: {str(e)}", 0)
+    
+    with _SYNTAX_CACHE_LOCK:
+        if len(_SYNTAX_CACHE) >= _SYNTAX_CACHE_MAX:
+            _SYNTAX_CACHE.pop(next(iter(_SYNTAX_CACHE)), None)
+        _SYNTAX_CACHE[key] = error
+    return error
+
+
+def _save_failed_attempts(failed_attempts: List[Tuple[int, str]]) -> str:
+    """Write rejected attempts to /tmp for debugging and return the last path"""
+    debug_path = ""
+    for attempt_number, code in failed_attempts:
+        debug_path = f"/tmp/generated_code_attempt_{attempt_number}.py"
+        with open(debug_path, 'w') as f:
+            f.write(code)
+    return debug_path
 
 
 def generate_agent_code_with_retry(
@@ -60,22 +191,23 @@ def generate_agent_code_with_retry(
     logger.info("Generating code with auto-retry...")
     
     additional_instructions = ""
+    temperature = 0.1
+    # Rejected code is kept in memory and only written out if every attempt fails
+    failed_attempts: List[Tuple[int, str]] = []
+    rejected_digests = set()
     
     for attempt in range(max_retries):
         try:
             # Try to generate code
-            result = generate_agent_code(yaml_specification, llm_client, style_guide, additional_instructions)
+            result = generate_agent_code(
+                yaml_specification, llm_client, style_guide, additional_instructions, temperature
+            )
             code = result["code"]
             
-            # Save for debugging if syntax error occurs
-            debug_path = f"/tmp/generated_code_attempt_{attempt + 1}.py"
-            with open(debug_path, 'w') as f:
-                f.write(code)
-            
             # Check syntax
-            syntax_error = _check_syntax(code)
+            syntax_check = _check_syntax(code)
             
-            if syntax_error is None:
+            if syntax_check is None:
                 # Success!
                 result["retry_count"] = attempt
                 if attempt > 0:
@@ -83,17 +215,20 @@ def generate_agent_code_with_retry(
                 return result
             else:
                 # Syntax error found
+                syntax_error, error_line_num = syntax_check
+                failed_attempts.append((attempt + 1, code))
+                digest = blake2b(code.encode('utf-8', 'surrogatepass'), digest_size=8).digest()
+                repeated = digest in rejected_digests
+                rejected_digests.add(digest)
                 logger.warning(f"Attempt {attempt + 1}/{max_retries}: Syntax error detected")
                 logger.warning(f"  Error: {syntax_error}")
-                logger.warning(f"  Debug: Code saved to {debug_path}")
                 
                 if attempt < max_retries - 1:
                     # Try again with feedback
                     logger.info(f"  Retrying with error feedback...")
                     
                     # Get code snippet around error line for context
-                    code_lines = code.split('\n')
-                    error_line_num = int(syntax_error.split('line ')[1].split(':')[0]) if 'line ' in syntax_error else 0
+                    code_lines = code.splitlines()
                     context_start = max(0, error_line_num - 3)
                     context_end = min(len(code_lines), error_line_num + 2)
                     context = '\n'.join(f"{i+1}: {line}" for i, line in enumerate(code_lines[context_start:context_end], start=context_start))
@@ -118,8 +253,18 @@ CRITICAL FIX REQUIRED:
 
 Generate COMPLETE, VALID Python code. Every function must have a body. Every class must be complete.
 """
+                    if repeated:
+                        # The same prompt produced the same rejected code; push the
+                        # model away from it instead of asking the same way again
+                        logger.warning("  Response identical to an earlier rejected attempt")
+                        additional_instructions += (
+                            "\nYour previous output was byte-identical to an earlier rejected "
+                            "attempt - produce a DIFFERENT solution.\n"
+                        )
+                        temperature = round(min(0.5, 0.1 + 0.1 * (attempt + 1)), 1)
                 else:
                     # Final attempt failed
+                    debug_path = _save_failed_attempts(failed_attempts)
                     logger.error(f"Failed to generate valid code after {max_retries} attempts")
                     logger.error(f"  Last generated code saved to: {debug_path}")
                     raise ValueError(
@@ -143,7 +288,8 @@ def generate_agent_code(
     yaml_specification: str,
     llm_client: LLMClient,
     style_guide: str = "pep8",
-    additional_instructions: str = ""
+    additional_instructions: str = "",
+    temperature: float = 0.1
 ) -> Dict[str, Any]:
     """
     Generate Python code for an agent from YAML specification.
@@ -153,6 +299,7 @@ def generate_agent_code(
         llm_client: LLM client instance
         style_guide: Code style to follow (default: pep8)
         additional_instructions: Additional instructions for retry attempts
+        temperature: Sampling temperature (default: 0.1)
     
     Returns:
         Dictionary with:
@@ -165,68 +312,17 @@ def generate_agent_code(
     """
     # Parse YAML to get agent details
     try:
-        spec = yaml.safe_load(yaml_specification)
+        spec = _parse_spec(yaml_specification)
         agent_name = spec.get("agent_name", "UnknownAgent")
         agent_type = spec.get("agent_type", "unknown")
         complexity = spec.get("complexity", "MEDIUM")
     except yaml.YAMLError as e:
         raise ValueError(f"Invalid YAML specification: {e}") from e
     
-    logger.info(f"Generating code for {agent_name}...")
-    logger.info(f"  Type: {agent_type}")
-    logger.info(f"  Complexity: {complexity}")
+    logger.bind(agent_name=agent_name, agent_type=agent_type, complexity=complexity).info(
+        f"Generating code for {agent_name}... (type: {agent_type}, complexity: {complexity})"
+    )
     
-    system_prompt = """You are an expert Python developer specializing in agent systems.
-Your task is to generate production-ready Python code from a YAML specification.
-
-REQUIREMENTS:
-1. Generate complete, working Python code
-2. Follow PEP 8 style guide strictly
-3. Use type hints throughout (from typing import ...)
-4. Include comprehensive docstrings (Google style)
-5. Use Pydantic for data validation
-6. Use loguru for logging
-7. Include error handling (try/except with specific exceptions)
-8. NO hardcoded values - all config from environment or parameters
-9. Make it compatible with the agent system (proper imports, structure)
-10. Include __init__ method with proper initialization
-11. All methods should have clear purpose and clean implementation
-12. ENSURE ALL CODE IS SYNTACTICALLY VALID - no incomplete functions or classes
-13. EVERY function and class MUST have a complete body
-14. ALL brackets, parentheses, and quotes MUST be properly closed
-
-SECURITY - CRITICAL RULES:
-- NEVER hardcode passwords, API keys, tokens, or secrets
-- ALWAYS use os.getenv() for sensitive configuration (e.g., os.getenv('DATABASE_URL'))
-- Database credentials must come from environment variables
-- Use empty strings "" for default password values, NOT example values like "admin" or "password123"
-- Example: password = os.getenv('DB_PASSWORD', '') ✓
-- Example: password = "admin" ✗ WRONG
-
-CODE STRUCTURE:
-- Imports at top (standard library, then third-party, then local)
-- Pydantic models for data structures (if needed)
-- Main agent class
-- All methods with docstrings
-- Proper error handling in each method
-- Logger statements for key operations
-
-CRITICAL - CODE COMPLETENESS:
-- The generated code MUST parse without syntax errors
-- DO NOT truncate output - generate the ENTIRE implementation
-- Every function definition needs a body (cannot end with just a colon)
-- Every class definition needs a body
-- All strings must be properly quoted
-- All parentheses, brackets, and braces must be balanced
-
-IMPORTANT:
-- Output ONLY Python code, no explanations
-- Code must be syntactically correct and complete
-- No placeholder or TODO comments
-- Complete, working implementation based on spec
-- All sensitive values from environment variables
-"""
-
     user_prompt = f"""Generate complete Python code for this agent:
 
 YAML SPECIFICATION:
@@ -237,30 +333,40 @@ YAML SPECIFICATION:
 Generate production-ready Python code following all requirements.
 The code should be complete and directly usable.{additional_instructions}"""
 
+    # Retries often follow truncated output, so they always get the full budget
+    if additional_instructions:
+        max_tokens = _MAX_TOKENS_CEILING
+    else:
+        max_tokens = _MAX_TOKENS_BY_COMPLEXITY.get(complexity, 2048)
+    
     try:
         # Call LLM to generate code
         code = llm_client.generate(
-            system_prompt=system_prompt,
+            system_prompt=_CODEGEN_SYSTEM_PROMPT,
             user_prompt=user_prompt,
-            temperature=0.1,
-            max_tokens=4096
+            temperature=temperature,
+            max_tokens=max_tokens
         )
         
         # Remove markdown code blocks if present
         code = code.strip()
-        if code.startswith("```python"):
-            code = code[9:]
-        if code.startswith("```"):
-            code = code[3:]
+        opening = _OPENING_FENCE_RE.match(code)
+        if opening:
+            code = code[opening.end():]
         if code.endswith("```"):
             code = code[:-3]
         code = code.strip()
         
-        # Calculate metadata
-        lines = len(code.split('\n'))
-        has_docstrings = '"""' in code or "'''" in code
-        has_type_hints = '->' in code or ': ' in code
-        has_error_handling = 'try:' in code and 'except' in code
+        # Calculate metadata in one scan, stopping once every marker is seen
+        lines = code.count('\n') + 1
+        found = set()
+        for match in _METADATA_RE.finditer(code):
+            found.add(_METADATA_MARKERS[match.group()])
+            if len(found) == 4:
+                break
+        has_docstrings = "docstring" in found
+        has_type_hints = "type_hint" in found
+        has_error_handling = "try" in found and "except" in found
         
         metadata = {
             "lines": lines,
@@ -272,11 +378,12 @@ The code should be complete and directly usable.{additional_instructions}"""
             "agent_type": agent_type
         }
         
-        logger.info(f"✓ Code generated for {agent_name}")
-        logger.info(f"  Lines: {lines}")
-        logger.info(f"  Docstrings: {'✓' if has_docstrings else '✗'}")
-        logger.info(f"  Type hints: {'✓' if has_type_hints else '✗'}")
-        logger.info(f"  Error handling: {'✓' if has_error_handling else '✗'}")
+        logger.bind(**metadata).info(
+            f"✓ Code generated for {agent_name}: {lines} lines, "
+            f"docstrings {'✓' if has_docstrings else '✗'}, "
+            f"type hints {'✓' if has_type_hints else '✗'}, "
+            f"error handling {'✓' if has_error_handling else '✗'}"
+        )
         
         return {
             "code": code,
@@ -311,7 +418,7 @@ def generate_multi_file_code(
     """
     # Parse YAML to check for internal components
     try:
-        spec = yaml.safe_load(yaml_specification)
+        spec = _parse_spec(yaml_specification)
         agent_name = spec.get("agent_name", "UnknownAgent")
         internal_components = spec.get("internal_components", [])
     except yaml.YAMLError as e:
@@ -323,34 +430,41 @@ def generate_multi_file_code(
         result = generate_agent_code(yaml_specification, llm_client)
         return {f"{agent_name.lower()}.py": result["code"]}
     
-    # Generate main agent file
+    # Generate main agent file first: if it fails there is nothing to attach
+    # components to, so no component calls are made
     logger.info(f"Generating multi-file code for {agent_name} with {len(internal_components)} components")
-    
     main_result = generate_agent_code(yaml_specification, llm_client)
     files = {
         f"{agent_name.lower()}.py": main_result["code"]
     }
     
-    # Generate each component as separate file
-    for component in internal_components:
-        logger.info(f"  Generating component: {component}")
-        
-        # Create mini-spec for component
-        component_spec = f"""
+    # Create mini-spec for each component
+    component_specs = [
+        f"""
 agent_name: {component}
 agent_type: component
 description: Component of {agent_name}
 parent_agent: {agent_name}
 role: internal_component
 """
-        
-        try:
-            component_result = generate_agent_code(component_spec, llm_client)
-            component_filename = f"{agent_name.lower()}_{component.lower()}.py"
-            files[component_filename] = component_result["code"]
-            logger.info(f"  ✓ Generated {component_filename}")
-        except Exception as e:
-            logger.warning(f"  Failed to generate {component}: {e}, will include in main file")
+        for component in internal_components
+    ]
+    
+    # Components are independent LLM calls, so they are generated concurrently
+    component_results = map_llm_calls(
+        lambda spec: generate_agent_code(spec, llm_client),
+        component_specs,
+        return_exceptions=True
+    )
+    
+    # Collect each component as separate file
+    for component, component_result in zip(internal_components, component_results):
+        if isinstance(component_result, BaseException):
+            logger.warning(f"  Failed to generate {component}: {component_result}, will include in main file")
+            continue
+        component_filename = f"{agent_name.lower()}_{component.lower()}.py"
+        files[component_filename] = component_result["code"]
+        logger.info(f"  ✓ Generated {component_filename}")
     
     return files
 
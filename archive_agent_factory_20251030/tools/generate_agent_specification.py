@@ -5,32 +5,250 @@ NO FALLBACKS - Strictly requires LLM.
 Includes auto-retry for invalid YAML.
 """
 
-from typing import Dict, Any, Optional
+import random
+import re
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Tuple, Union
 from loguru import logger
 import yaml
 
-from meta_agent.utils.llm_client import LLMClient
+# libyaml's C loader when PyYAML was built against it, pure Python otherwise
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+from meta_agent.utils.llm_client import LLMClient, map_llm_calls
 from meta_agent.tools.design_agent_architecture import AgentDesign, ArchitectureDesign
 from meta_agent.tools.analyze_requirements import RequirementsAnalysis
 
 
-def _check_yaml_validity(yaml_text: str) -> Optional[str]:
+# The schema template never changes, so it is a byte-identical prefix the LLM
+# server can reuse from cache for every agent and every retry
+_SPEC_SYSTEM_PROMPT = """You are an expert in agent system design and YAML specification.
+Your task is to generate a complete, detailed YAML specification for an agent.
+
+The specification must follow this structure:
+
+agent_name: AgentName
+agent_type: type
+version: 1.0.0
+description: |
+  Detailed description
+
+role: tool|primary_agent|supporting_agent
+
+capabilities:
+  - name: capability_name
+    description: What this capability does
+    inputs:
+      - name: input_name
+        type: type
+        required: true|false
+        validation: validation_rule
+    outputs:
+      - name: output_name
+        type: type
+        schema: {...}
+    error_handling:
+      - error: ErrorType
+        action: how_to_handle
+        message: error_message
+
+data_sources:  # If agent accesses data
+  - type: postgresql|api|file
+    connection: connection_string_or_config
+    tables: [table1, table2]  # for databases
+
+workflow:  # If agent has complex workflow
+  steps:
+    step_name:
+      description: what this step does
+      logic: |
+        Detailed logic description
+      branches: ...  # if conditional
+
+tools:  # If agent uses other agents/tools
+  - name: ToolName
+    purpose: why this tool is used
+    calls: [method1, method2]
+
+dependencies:
+  python_packages:
+    - package==version
+  internal_agents:
+    - AgentName
+  external_services:
+    - name: ServiceName
+      required: true|false
+
+performance:
+  timeout_seconds: 30
+  cache_enabled: true|false
+
+logging:
+  level: INFO
+  log_queries: true|false
+
+testing:
+  test_scenarios:
+    - name: scenario_name
+      input: {...}
+      expected: result
+
+IMPORTANT: 
+- Be specific and detailed
+- Include all capabilities
+- Define clear inputs/outputs
+- Specify error handling
+- Output ONLY valid YAML, no other text
+- Use proper YAML indentation (2 spaces)
+"""
+
+
+# Output token budget for one specification
+_SPEC_MAX_TOKENS = 4096
+
+# Conservative characters-per-token ratio for estimating prompt size against
+# the model's context window (over-estimates tokens for English and YAML)
+_CHARS_PER_TOKEN = 3
+
+# Lines of streamed YAML received between incremental syntax checks
+_STREAM_CHECK_LINES = 10
+
+# Leading ``` or ```yaml of a fenced response; re.match is anchored at the
+# start, so it never reads into the document itself
+_OPENING_FENCE_RE = re.compile(r"```(?:yaml)?")
+
+# A line holding only '---' separates documents in a batched YAML stream
+_DOCUMENT_SEPARATOR_RE = re.compile(r"^---[ \t]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=32)
+def _requirements_context(
+    primary_goal: str,
+    data_sources: Tuple[str, ...],
+    calculations_count: int,
+    modes: Tuple[str, ...]
+) -> str:
+    """Render the REQUIREMENTS CONTEXT block shared by every agent of a system."""
+    return f"""REQUIREMENTS CONTEXT:
+- Primary Goal: {primary_goal}
+- Data Sources: {', '.join(data_sources)}
+- Calculations: {calculations_count} needed
+- Modes: {', '.join(modes)}"""
+
+
+@lru_cache(maxsize=32)
+def _other_agents(agent_names: Tuple[str, ...], agent_name: str) -> str:
+    """Comma-separated names of every agent in the system except agent_name."""
+    return ', '.join(name for name in agent_names if name != agent_name)
+
+
+@lru_cache(maxsize=128)
+def _bullet_list(items: Tuple[str, ...]) -> str:
+    """Render items as '- item' lines, once per distinct list."""
+    return "\n".join(f"- {item}" for item in items)
+
+
+def _agent_details(agent_design: AgentDesign, architecture: ArchitectureDesign) -> str:
+    """Render the agent-specific part of the specification prompt."""
+    # Build context about other agents for cross-references
+    other_agents = _other_agents(
+        tuple(a.agent_name for a in architecture.agents), agent_design.agent_name
+    )
+    return f"""AGENT NAME: {agent_design.agent_name}
+AGENT TYPE: {agent_design.agent_type}
+ROLE: {agent_design.role}
+COMPLEXITY: {agent_design.complexity}
+
+RESPONSIBILITIES:
+{_bullet_list(tuple(agent_design.responsibilities))}
+
+DEPENDENCIES:
+{_bullet_list(tuple(agent_design.dependencies))}
+
+INTERNAL COMPONENTS: {', '.join(agent_design.internal_components) if agent_design.internal_components else 'None'}
+USES LLM: {agent_design.uses_llm}
+
+OTHER AGENTS IN SYSTEM: {other_agents}"""
+
+
+def _strip_code_fences(text: str) -> str:
+    """Remove markdown code blocks if present."""
+    text = text.strip()
+    opening = _OPENING_FENCE_RE.match(text)
+    if opening:
+        text = text[opening.end():]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def _complete_yaml_lines(text: str) -> List[str]:
+    """Complete lines of a partial YAML response, without markdown fences."""
+    lines = text[:text.rfind("\n")].split("\n")
+    start = 0
+    while start < len(lines) and not lines[start].strip():
+        start += 1
+    if start < len(lines) and lines[start].startswith("```"):
+        start += 1
+    for end in range(start, len(lines)):
+        if lines[end].startswith("```"):
+            return lines[start:end]
+    return lines[start:]
+
+
+def _stream_yaml(llm_client: LLMClient, user_prompt: str) -> str:
     """
-    Check if YAML is valid and return error message if not.
+    Stream a YAML specification, checking its syntax as lines arrive.
     
-    Args:
-        yaml_text: YAML text to check
+    A syntax error before the last received line cannot be fixed by text still
+    to come, so the stream is closed there instead of generating the rest.
     
-    Returns:
-        Error message if invalid, None if valid
+    Raises:
+        yaml.YAMLError: At the first syntax error that later text cannot fix
     """
+    chunks: List[str] = []
+    unchecked_lines = 0
+    stream = llm_client.generate_stream(
+        system_prompt=_SPEC_SYSTEM_PROMPT,
+        user_prompt=user_prompt,
+        temperature=0.1,
+        max_tokens=4096  # Specs can be long
+    )
     try:
-        yaml.safe_load(yaml_text)
-        return None
-    except yaml.YAMLError as e:
-        return str(e)
-    except Exception as e:
-        return f"Parse error: {str(e)}"
+        for chunk in stream:
+            chunks.append(chunk)
+            unchecked_lines += chunk.count("\n")
+            if unchecked_lines < _STREAM_CHECK_LINES:
+                continue
+            unchecked_lines = 0
+            
+            lines = _complete_yaml_lines("".join(chunks))
+            try:
+                for _ in yaml.parse("\n".join(lines), Loader=SafeLoader):
+                    pass
+            except yaml.MarkedYAMLError as e:
+                # An error on the last line may only be a line cut short
+                if e.problem_mark is not None and e.problem_mark.line < len(lines) - 1:
+                    logger.warning(f"Invalid YAML at line {e.problem_mark.line + 1}, stopping generation early")
+                    raise
+    finally:
+        stream.close()
+    
+    return "".join(chunks)
+
+
+def _requirements_context_for(requirements: RequirementsAnalysis) -> str:
+    """Look up the cached REQUIREMENTS CONTEXT block for requirements."""
+    return _requirements_context(
+        requirements.primary_goal,
+        tuple(requirements.data_sources),
+        len(requirements.calculations_needed),
+        tuple(requirements.modes_required)
+    )
 
 
 def generate_agent_specification_with_retry(
@@ -38,20 +256,29 @@ def generate_agent_specification_with_retry(
     architecture: ArchitectureDesign,
     requirements: RequirementsAnalysis,
     llm_client: LLMClient,
-    max_retries: int = 5
-) -> str:
+    max_retries: int = 5,
+    backoff_base: float = 1.0,
+    backoff_max_delay: float = 30.0
+) -> Tuple[str, Dict[str, Any]]:
     """
     Generate YAML specification with automatic retry on invalid YAML.
     
+    Invalid YAML is retried immediately with error feedback, since the cause is
+    the content. Any other failure (connection, rate limit, server error) is
+    retried after an exponential backoff with jitter, so agents failing together
+    do not hit LM Studio again in lockstep.
+    
     Args:
         agent_design: Design for the specific agent
         architecture: Full architecture context
         requirements: Original requirements
         llm_client: LLM client instance
         max_retries: Maximum number of retry attempts
+        backoff_base: Base delay in seconds for transport-error backoff
+        backoff_max_delay: Upper bound in seconds for a single backoff delay
     
     Returns:
-        Valid YAML specification as string
+        Tuple of (valid YAML specification as string, parsed specification)
     
     Raises:
         RuntimeError: If LLM is not available
@@ -63,19 +290,20 @@ def generate_agent_specification_with_retry(
     
     for attempt in range(max_retries):
         try:
-            # Try to generate specification
-            yaml_spec = generate_agent_specification(
-                agent_design, architecture, requirements, llm_client, additional_instructions
-            )
-            
-            # Check YAML validity
-            yaml_error = _check_yaml_validity(yaml_spec)
+            # Try to generate specification; the YAML is parsed exactly once there
+            try:
+                yaml_spec, spec_dict = generate_agent_specification(
+                    agent_design, architecture, requirements, llm_client, additional_instructions
+                )
+                yaml_error = None
+            except yaml.YAMLError as e:
+                yaml_error = str(e)
             
             if yaml_error is None:
                 # Success!
                 if attempt > 0:
                     logger.info(f"✓ Specification generated successfully after {attempt} retries")
-                return yaml_spec
+                return yaml_spec, spec_dict
             else:
                 # YAML error found
                 logger.warning(f"Attempt {attempt + 1}/{max_retries}: Invalid YAML detected")
@@ -123,6 +351,9 @@ def generate_agent_specification_with_retry(
             logger.error(f"Attempt {attempt + 1}/{max_retries}: Generation error: {e}")
             if attempt >= max_retries - 1:
                 raise RuntimeError(f"Specification generation failed after {max_retries} attempts: {e}") from e
+            delay = min(backoff_base * 2 ** attempt + random.uniform(0, backoff_base), backoff_max_delay)
+            logger.info(f"  Retrying in {delay:.1f}s...")
+            time.sleep(delay)
     
     raise RuntimeError("Specification generation failed: Maximum retries reached")
 
@@ -133,7 +364,7 @@ def generate_agent_specification(
     requirements: RequirementsAnalysis,
     llm_client: LLMClient,
     additional_instructions: str = ""
-) -> str:
+) -> Tuple[str, Dict[str, Any]]:
     """
     Generate detailed YAML specification for an agent.
     
@@ -145,161 +376,54 @@ def generate_agent_specification(
         additional_instructions: Additional instructions for retry attempts
     
     Returns:
-        YAML specification as string
+        Tuple of (YAML specification as string, parsed specification)
     
     Raises:
-        RuntimeError: If LLM is not available
-        ValueError: If LLM response is invalid YAML
+        RuntimeError: If LLM is not available or generation fails
+        yaml.YAMLError: If LLM response is not a valid YAML mapping
     """
     logger.info(f"Generating specification for {agent_design.agent_name}...")
     logger.info(f"  Type: {agent_design.agent_type}")
     logger.info(f"  Role: {agent_design.role}")
     logger.info(f"  Complexity: {agent_design.complexity}")
     
-    # Build context about other agents for cross-references
-    other_agents = [a.agent_name for a in architecture.agents if a.agent_name != agent_design.agent_name]
-    
-    system_prompt = """You are an expert in agent system design and YAML specification.
-Your task is to generate a complete, detailed YAML specification for an agent.
+    # Ordered from most to least shared: the requirements context is the same
+    # for every agent of a system, and retry feedback only ever comes last.
+    # Context shared across agents and retries is cached by value.
+    user_prompt = f"""{_requirements_context_for(requirements)}
 
-The specification must follow this structure:
+Generate a complete YAML specification for this agent:
 
-agent_name: AgentName
-agent_type: type
-version: 1.0.0
-description: |
-  Detailed description
-
-role: tool|primary_agent|supporting_agent
-
-capabilities:
-  - name: capability_name
-    description: What this capability does
-    inputs:
-      - name: input_name
-        type: type
-        required: true|false
-        validation: validation_rule
-    outputs:
-      - name: output_name
-        type: type
-        schema: {...}
-    error_handling:
-      - error: ErrorType
-        action: how_to_handle
-        message: error_message
-
-data_sources:  # If agent accesses data
-  - type: postgresql|api|file
-    connection: connection_string_or_config
-    tables: [table1, table2]  # for databases
-
-workflow:  # If agent has complex workflow
-  steps:
-    step_name:
-      description: what this step does
-      logic: |
-        Detailed logic description
-      branches: ...  # if conditional
-
-tools:  # If agent uses other agents/tools
-  - name: ToolName
-    purpose: why this tool is used
-    calls: [method1, method2]
-
-dependencies:
-  python_packages:
-    - package==version
-  internal_agents:
-    - AgentName
-  external_services:
-    - name: ServiceName
-      required: true|false
-
-performance:
-  timeout_seconds: 30
-  cache_enabled: true|false
-
-logging:
-  level: INFO
-  log_queries: true|false
-
-testing:
-  test_scenarios:
-    - name: scenario_name
-      input: {...}
-      expected: result
-
-IMPORTANT: 
-- Be specific and detailed
-- Include all capabilities
-- Define clear inputs/outputs
-- Specify error handling
-- Output ONLY valid YAML, no other text
-- Use proper YAML indentation (2 spaces)
-"""
-
-    user_prompt = f"""Generate a complete YAML specification for this agent:
-
-AGENT NAME: {agent_design.agent_name}
-AGENT TYPE: {agent_design.agent_type}
-ROLE: {agent_design.role}
-COMPLEXITY: {agent_design.complexity}
-
-RESPONSIBILITIES:
-{chr(10).join(['- ' + r for r in agent_design.responsibilities])}
-
-DEPENDENCIES:
-{chr(10).join(['- ' + d for d in agent_design.dependencies])}
-
-INTERNAL COMPONENTS: {', '.join(agent_design.internal_components) if agent_design.internal_components else 'None'}
-USES LLM: {agent_design.uses_llm}
-
-OTHER AGENTS IN SYSTEM: {', '.join(other_agents)}
-
-REQUIREMENTS CONTEXT:
-- Primary Goal: {requirements.primary_goal}
-- Data Sources: {', '.join(requirements.data_sources)}
-- Calculations: {len(requirements.calculations_needed)} needed
-- Modes: {', '.join(requirements.modes_required)}
+{_agent_details(agent_design, architecture)}
 
 Generate the complete YAML specification following the structure provided.
 {additional_instructions}"""
 
     try:
-        # Call LLM to generate specification
-        yaml_spec = llm_client.generate(
-            system_prompt=system_prompt,
-            user_prompt=user_prompt,
-            temperature=0.1,
-            max_tokens=4096  # Specs can be long
-        )
+        # Call LLM to generate specification, abandoning it at the first
+        # syntax error rather than paying for the full token budget
+        yaml_spec = _stream_yaml(llm_client, user_prompt)
         
-        # Remove markdown code blocks if present
-        yaml_spec = yaml_spec.strip()
-        if yaml_spec.startswith("```yaml"):
-            yaml_spec = yaml_spec[7:]
-        if yaml_spec.startswith("```"):
-            yaml_spec = yaml_spec[3:]
-        if yaml_spec.endswith("```"):
-            yaml_spec = yaml_spec[:-3]
-        yaml_spec = yaml_spec.strip()
+        yaml_spec = _strip_code_fences(yaml_spec)
         
-        # Validate YAML syntax
+        # Validate YAML syntax; the parsed form is returned so no caller re-parses
         try:
-            yaml_dict = yaml.safe_load(yaml_spec)
-            if not isinstance(yaml_dict, dict):
-                raise ValueError("YAML must be a dictionary at root level")
+            yaml_dict = yaml.load(yaml_spec, Loader=SafeLoader)
         except yaml.YAMLError as e:
             logger.error(f"Invalid YAML syntax: {e}")
-            raise ValueError(f"Generated specification has invalid YAML syntax: {e}") from e
+            raise
+        if not isinstance(yaml_dict, dict):
+            raise yaml.YAMLError("YAML must be a dictionary at root level")
         
         logger.info(f"✓ Specification generated for {agent_design.agent_name}")
         logger.info(f"  YAML size: {len(yaml_spec)} characters")
         logger.info(f"  Top-level keys: {list(yaml_dict.keys())}")
         
-        return yaml_spec
+        return yaml_spec, yaml_dict
         
+    except yaml.YAMLError:
+        # Invalid YAML is the caller's to retry with feedback, not an LLM failure
+        raise
     except Exception as e:
         logger.error(f"Failed to generate specification: {e}")
         raise RuntimeError(
@@ -308,12 +432,176 @@ Generate the complete YAML specification following the structure provided.
         ) from e
 
 
-def validate_specification_structure(yaml_spec: str) -> bool:
+def _batch_user_prompt(
+    agents: List[AgentDesign],
+    architecture: ArchitectureDesign,
+    requirements: RequirementsAnalysis
+) -> str:
+    """Build the user prompt asking for one YAML document per agent."""
+    agent_sections = "\n\n".join(
+        f"### AGENT {index}\n{_agent_details(agent_design, architecture)}"
+        for index, agent_design in enumerate(agents, 1)
+    )
+    return f"""{_requirements_context_for(requirements)}
+
+Generate a complete YAML specification for EACH of these {len(agents)} agents:
+
+{agent_sections}
+
+Output exactly {len(agents)} YAML documents in the order listed, each following the structure provided,
+separated by a line containing only '---'. Each document's agent_name must match the AGENT NAME above."""
+
+
+def _estimate_prompt_tokens(user_prompt: str) -> int:
+    """Estimate the input tokens of a specification request."""
+    return (len(_SPEC_SYSTEM_PROMPT) + len(user_prompt)) // _CHARS_PER_TOKEN + 1
+
+
+def _plan_batches(
+    architecture: ArchitectureDesign,
+    requirements: RequirementsAnalysis,
+    context_length: int
+) -> List[List[AgentDesign]]:
+    """
+    Group agents, in architecture order, so each group's prompt plus a full
+    output budget per agent fits in the model's context window.
+    """
+    groups: List[List[AgentDesign]] = []
+    current: List[AgentDesign] = []
+    for agent_design in architecture.agents:
+        candidate = current + [agent_design]
+        prompt_tokens = _estimate_prompt_tokens(_batch_user_prompt(candidate, architecture, requirements))
+        if current and prompt_tokens + _SPEC_MAX_TOKENS * len(candidate) > context_length:
+            groups.append(current)
+            candidate = [agent_design]
+        current = candidate
+    if current:
+        groups.append(current)
+    return groups
+
+
+def _generate_batch(
+    agents: List[AgentDesign],
+    architecture: ArchitectureDesign,
+    requirements: RequirementsAnalysis,
+    llm_client: LLMClient
+) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """
+    Request specifications for agents in one call and keep the valid documents.
+
+    Returns:
+        Dict mapping agent name to (YAML specification, parsed specification) for
+        every agent of the group whose document was usable
+    """
+    user_prompt = _batch_user_prompt(agents, architecture, requirements)
+    # Whatever the prompt leaves of the context window, up to a full budget per agent
+    max_tokens = min(
+        _SPEC_MAX_TOKENS * len(agents),
+        llm_client.context_length - _estimate_prompt_tokens(user_prompt)
+    )
+
+    try:
+        response = llm_client.generate(
+            system_prompt=_SPEC_SYSTEM_PROMPT,
+            user_prompt=user_prompt,
+            temperature=0.1,
+            max_tokens=max_tokens
+        )
+    except Exception as e:
+        logger.warning(f"Batched specification request failed, generating per agent: {e}")
+        return {}
+
+    names = {a.agent_name for a in agents}
+    batched: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    # Documents are parsed one by one so a single bad document only fails its agent
+    for document in _DOCUMENT_SEPARATOR_RE.split(_strip_code_fences(response)):
+        yaml_spec = _strip_code_fences(document)
+        if not yaml_spec:
+            continue
+        try:
+            spec_dict = yaml.load(yaml_spec, Loader=SafeLoader)
+            if not isinstance(spec_dict, dict):
+                continue
+            validate_specification_structure(spec_dict)
+        except (yaml.YAMLError, ValueError) as e:
+            logger.warning(f"  Discarding invalid document from batch: {e}")
+            continue
+        agent_name = str(spec_dict["agent_name"])
+        if agent_name in names:
+            batched.setdefault(agent_name, (yaml_spec, spec_dict))
+    return batched
+
+
+def generate_all_specifications(
+    architecture: ArchitectureDesign,
+    requirements: RequirementsAnalysis,
+    llm_client: LLMClient,
+    max_retries: int = 5
+) -> Dict[str, Tuple[str, Dict[str, Any]]]:
+    """
+    Generate YAML specifications for every agent with as few LLM calls as the
+    model's context window allows.
+
+    The schema template and requirements context are sent once per batch instead
+    of once per agent. Agents are batched only as far as their prompt and output
+    budget fit in LLMClient.context_length; an agent that fits only on its own is
+    generated individually. Agents whose document is missing, invalid YAML or
+    structurally invalid fall back to generate_agent_specification_with_retry,
+    so only the failed subset pays for individual requests.
+
+    Args:
+        architecture: Architecture whose agents need specifications
+        requirements: Original requirements
+        llm_client: LLM client instance
+        max_retries: Maximum number of retry attempts per fallback agent
+
+    Returns:
+        Dict mapping agent name to (YAML specification as string, parsed specification),
+        in architecture order
+
+    Raises:
+        RuntimeError: If LLM is not available
+        ValueError: If a fallback agent's specification still fails after retries
+    """
+    agents = architecture.agents
+    batches = [
+        group for group in _plan_batches(architecture, requirements, llm_client.context_length)
+        if len(group) > 1
+    ]
+    logger.info(
+        f"Generating specifications for {len(agents)} agents "
+        f"({sum(map(len, batches))} in {len(batches)} batched requests)..."
+    )
+
+    batched: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+    for result in map_llm_calls(
+        lambda group: _generate_batch(group, architecture, requirements, llm_client), batches
+    ):
+        batched.update(result)
+
+    failed: List[AgentDesign] = [a for a in agents if a.agent_name not in batched]
+    logger.info(f"✓ {len(agents) - len(failed)}/{len(agents)} specifications from batched requests")
+
+    if failed:
+        logger.info(f"  Generating per agent: {', '.join(a.agent_name for a in failed)}")
+
+        def generate_one(agent_design: AgentDesign) -> Tuple[str, Dict[str, Any]]:
+            return generate_agent_specification_with_retry(
+                agent_design, architecture, requirements, llm_client, max_retries
+            )
+
+        for agent_design, result in zip(failed, map_llm_calls(generate_one, failed)):
+            batched[agent_design.agent_name] = result
+
+    return {a.agent_name: batched[a.agent_name] for a in agents}
+
+
+def validate_specification_structure(yaml_spec: Union[str, Dict[str, Any]]) -> bool:
     """
     Validate that specification has required structure.
     
     Args:
-        yaml_spec: YAML specification string
+        yaml_spec: YAML specification string, or the already parsed specification
     
     Returns:
         True if valid
@@ -323,10 +611,13 @@ def validate_specification_structure(yaml_spec: str) -> bool:
     """
     logger.info("Validating specification structure...")
     
-    try:
-        spec_dict = yaml.safe_load(yaml_spec)
-    except yaml.YAMLError as e:
-        raise ValueError(f"Invalid YAML syntax: {e}") from e
+    if isinstance(yaml_spec, dict):
+        spec_dict = yaml_spec
+    else:
+        try:
+            spec_dict = yaml.load(yaml_spec, Loader=SafeLoader)
+        except yaml.YAMLError as e:
+            raise ValueError(f"Invalid YAML syntax: {e}") from e
     
     # Check required top-level fields
     required_fields = ["agent_name", "agent_type", "version", "description", "role"]
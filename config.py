@@ -26,6 +26,8 @@ class Settings(BaseSettings):
     llm_temperature: float = Field(..., description="Temperature for code generation")
     llm_max_tokens: int = Field(..., description="Max tokens per response")
     llm_context_length: int = Field(..., description="Context window size")
+    # Optional: LM Studio serves a handful of requests in parallel before they queue
+    llm_max_concurrent_calls: int = Field(default=4, description="LLM requests in flight at once")
     
     # ==================== Database Configuration ====================
     # REQUIRED: PostgreSQL connection, no fallbacks
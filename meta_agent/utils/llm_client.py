@@ -4,7 +4,9 @@ Connects to LM Studio with NO FALLBACKS.
 System fails explicitly if LM Studio is not available.
 """
 
-from typing import Dict, Any, Optional, List
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Iterable, Iterator, Optional, List, Tuple, TypeVar
 from loguru import logger
 import httpx
 from langchain_openai import ChatOpenAI
@@ -13,6 +15,40 @@ from langchain_core.messages import SystemMessage, HumanMessage
 from config import settings
 
 
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def map_llm_calls(
+    func: Callable[[T], R],
+    items: Iterable[T],
+    return_exceptions: bool = False
+) -> List[Any]:
+    """
+    Apply func, which calls the LLM, to each item in worker threads.
+    
+    LLMClient caps its own requests in flight at settings.llm_max_concurrent_calls,
+    so nested calls cannot oversubscribe LM Studio; the pool is sized to match.
+    
+    Args:
+        func: Blocking function making LLM calls
+        items: Inputs for func
+        return_exceptions: Return an exception raised by func in place of its
+            result instead of raising it
+    
+    Returns:
+        Results in input order
+    """
+    items = list(items)
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(settings.llm_max_concurrent_calls, len(items))) as executor:
+        futures = [executor.submit(func, item) for item in items]
+    if return_exceptions:
+        return [future.exception() or future.result() for future in futures]
+    return [future.result() for future in futures]
+
+
 class LLMClient:
     """
     Client for LM Studio LLM API.
@@ -38,9 +74,17 @@ class LLMClient:
         self.max_tokens = settings.llm_max_tokens
         self.context_length = settings.llm_context_length
         
+        # Requests in flight through this client, across all threads
+        self._call_slots = threading.BoundedSemaphore(settings.llm_max_concurrent_calls)
+        
         self.available = False
         self.llm: Optional[ChatOpenAI] = None
         
+        # Prompt tokens the server answered from its prefix cache. Callers keep
+        # static system prompts byte-identical across calls so they can hit.
+        self.cache_read_input_tokens = 0
+        self._usage_lock = threading.Lock()
+        
         logger.debug(f"Initializing LLM client: {self.model_name}")
         logger.debug(f"LM Studio URL: {self.base_url}")
         
@@ -161,29 +205,18 @@ class LLMClient:
             )
         
         try:
-            # Use override values if provided
-            temp = temperature if temperature is not None else self.temperature
-            tokens = max_tokens if max_tokens is not None else self.max_tokens
-            
-            # Update LLM config if overrides provided
-            if temperature is not None or max_tokens is not None:
-                self.llm.temperature = temp
-                self.llm.max_tokens = tokens
+            messages, params = self._prepare_call(system_prompt, user_prompt, temperature, max_tokens)
             
-            messages = [
-                SystemMessage(content=system_prompt),
-                HumanMessage(content=user_prompt)
-            ]
-            
-            logger.debug(f"Generating with temperature={temp}, max_tokens={tokens}")
-            logger.debug(f"System prompt length: {len(system_prompt)} chars")
-            logger.debug(f"User prompt length: {len(user_prompt)} chars")
-            
-            response = self.llm.invoke(messages)
+            # generate rather than invoke: only the LLMResult carries token usage
+            with self._call_slots:
+                result = self.llm.generate([messages], **params)
+            response = result.generations[0][0].message
             
             if not response.content:
                 raise RuntimeError("LLM returned empty response")
             
+            self._record_usage((result.llm_output or {}).get("token_usage"))
+            
             logger.debug(f"Response length: {len(response.content)} chars")
             
             return response.content
@@ -195,6 +228,109 @@ class LLMClient:
                 f"This may indicate LM Studio crashed or model unloaded."
             ) from e
     
+    def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = None
+    ) -> Iterator[str]:
+        """
+        Generate text from LLM, yielding it in chunks as they arrive.
+        
+        The OpenAI stream is iterated directly rather than through LangChain,
+        which never closes it: closing the generator before it is exhausted
+        closes the HTTP connection, so LM Studio stops generating the rest of
+        the response.
+        
+        Args:
+            system_prompt: System instruction for the LLM
+            user_prompt: User's request/query
+            temperature: Override default temperature (optional)
+            max_tokens: Override default max tokens (optional)
+        
+        Yields:
+            Generated text chunks
+        
+        Raises:
+            RuntimeError: If LLM is not available
+            RuntimeError: If generation fails
+        """
+        if not self.available:
+            raise RuntimeError(
+                "LLM is not available. Cannot generate without LM Studio. "
+                "Please ensure LM Studio is running with model loaded."
+            )
+        
+        try:
+            _, params = self._prepare_call(system_prompt, user_prompt, temperature, max_tokens)
+            
+            length = 0
+            # The slot is held until the stream is exhausted or closed
+            with self._call_slots:
+                stream = self.llm.client.create(
+                    model=self.model_name,
+                    messages=[
+                        {"role": "system", "content": system_prompt},
+                        {"role": "user", "content": user_prompt}
+                    ],
+                    stream=True,
+                    **params
+                )
+                try:
+                    for chunk in stream:
+                        content = chunk.choices[0].delta.content if chunk.choices else None
+                        if content:
+                            length += len(content)
+                            yield content
+                finally:
+                    stream.close()
+            
+            if not length:
+                raise RuntimeError("LLM returned empty response")
+            
+            logger.debug(f"Response length: {length} chars")
+        
+        except Exception as e:
+            logger.error(f"LLM generation failed: {e}")
+            raise RuntimeError(
+                f"LLM generation failed: {e}. "
+                f"This may indicate LM Studio crashed or model unloaded."
+            ) from e
+    
+    def _prepare_call(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: Optional[float],
+        max_tokens: Optional[int]
+    ) -> Tuple[List[Any], Dict[str, Any]]:
+        """Build the messages and the per-call request parameters."""
+        # Use override values if provided
+        temp = temperature if temperature is not None else self.temperature
+        tokens = max_tokens if max_tokens is not None else self.max_tokens
+        
+        logger.debug(f"Generating with temperature={temp}, max_tokens={tokens}")
+        logger.debug(f"System prompt length: {len(system_prompt)} chars")
+        logger.debug(f"User prompt length: {len(user_prompt)} chars")
+        
+        messages = [
+            SystemMessage(content=system_prompt),
+            HumanMessage(content=user_prompt)
+        ]
+        # Overrides travel with the request rather than being set on the shared
+        # ChatOpenAI instance, since several threads generate through one client
+        return messages, {"temperature": temp, "max_tokens": tokens}
+    
+    def _record_usage(self, token_usage: Optional[Dict[str, Any]]) -> None:
+        """Add the prompt tokens the server served from its prefix cache, if reported."""
+        details = (token_usage or {}).get("prompt_tokens_details") or {}
+        cached_tokens = details.get("cached_tokens") or 0
+        if cached_tokens:
+            with self._usage_lock:
+                self.cache_read_input_tokens += cached_tokens
+            logger.debug(f"Prompt cache hit: {cached_tokens} input tokens")
+    
     def generate_json(
         self,
         system_prompt: str,
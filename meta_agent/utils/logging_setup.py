@@ -0,0 +1,28 @@
+"""
+Logging Setup
+Shared console logger configuration for command-line scripts
+"""
+
+import sys
+from functools import lru_cache
+from loguru import logger
+
+
+LOG_FORMAT = "<green>{time:HH:mm:ss}</green> | <level>{level: <8}</level> | <level>{message}</level>"
+
+
+@lru_cache(maxsize=1)
+def configure_logger() -> None:
+    """
+    Replace loguru's default handler with the colored INFO console handler.
+
+    Runs once per process; later calls are no-ops, so importing several
+    scripts never registers duplicate handlers.
+    """
+    logger.remove()
+    logger.add(
+        sys.stdout,
+        colorize=True,
+        format=LOG_FORMAT,
+        level="INFO"
+    )